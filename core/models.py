@@ -4,9 +4,17 @@ Provides strongly typed configuration and validation for all widgets.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, Optional, Union, List, Callable, TypeVar, Generic
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Optional, Union, List, Callable, TypeVar, Generic, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 from pydantic_extra_types.color import Color
 from pathlib import Path
 
@@ -74,9 +82,23 @@ class ButtonVariant(str, Enum):
 # =============================================================================
 
 
+@lru_cache(maxsize=1024)
+def _color(value: str) -> Color:
+    """Shared Color instance for a color literal."""
+    return Color(value)
+
+
+def _with_alpha(color: Color, alpha: float) -> Color:
+    """Shared Color instance for ``color`` at the given opacity."""
+    r, g, b = color.as_rgb_tuple(alpha=False)
+    return _color(f"rgba({r}, {g}, {b}, {alpha})")
+
+
 class Size(BaseModel):
     """Represents size with unit."""
 
+    model_config = ConfigDict(frozen=True)
+
     value: Union[int, float]
     unit: SizeUnit = SizeUnit.PX
 
@@ -85,16 +107,29 @@ class Size(BaseModel):
 
     @classmethod
     def px(cls, value: Union[int, float]) -> Size:
-        return cls(value=value, unit=SizeUnit.PX)
+        if cls is Size:
+            return _size_px(value)
+        # trusted: numeric value and known unit, skip validation
+        return cls.model_construct(value=value, unit=SizeUnit.PX)
 
     @classmethod
     def percent(cls, value: Union[int, float]) -> Size:
-        return cls(value=value, unit=SizeUnit.PERCENT)
+        # trusted: numeric value and known unit, skip validation
+        return cls.model_construct(value=value, unit=SizeUnit.PERCENT)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _size_px(value: Union[int, float]) -> Size:
+    """Shared pixel Size instance (typed, so 1 and 1.0 stay distinct)."""
+    # trusted: numeric value and known unit, skip validation
+    return Size.model_construct(value=value, unit=SizeUnit.PX)
 
 
 class Spacing(BaseModel):
     """Spacing configuration (margin/padding)."""
 
+    model_config = ConfigDict(frozen=True)
+
     top: Size = Size.px(0)
     right: Size = Size.px(0)
     bottom: Size = Size.px(0)
@@ -104,7 +139,8 @@ class Spacing(BaseModel):
     def all(cls, value: Union[int, float, Size]) -> Spacing:
         """Create uniform spacing."""
         size = Size.px(value) if isinstance(value, (int, float)) else value
-        return cls(top=size, right=size, bottom=size, left=size)
+        # trusted: every side is a Size at this point
+        return cls.model_construct(top=size, right=size, bottom=size, left=size)
 
     @classmethod
     def symmetric(
@@ -117,14 +153,19 @@ class Spacing(BaseModel):
         h_size = (
             Size.px(horizontal) if isinstance(horizontal, (int, float)) else horizontal
         )
-        return cls(top=v_size, bottom=v_size, left=h_size, right=h_size)
+        # trusted: every side is a Size at this point
+        return cls.model_construct(
+            top=v_size, bottom=v_size, left=h_size, right=h_size
+        )
 
 
 class Border(BaseModel):
     """Border configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     width: Size = Size.px(1)
-    color: Color = Color("#cccccc")
+    color: Color = _color("#cccccc")
     style: str = "solid"
     radius: Size = Size.px(0)
 
@@ -135,11 +176,13 @@ class Border(BaseModel):
 class Shadow(BaseModel):
     """Box shadow configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     x: Size = Size.px(0)
     y: Size = Size.px(2)
     blur: Size = Size.px(4)
     spread: Size = Size.px(0)
-    color: Color = Color("rgba(0, 0, 0, 0.1)")
+    color: Color = _color("rgba(0, 0, 0, 0.1)")
     inset: bool = False
 
     def to_css(self) -> str:
@@ -150,12 +193,14 @@ class Shadow(BaseModel):
 class Typography(BaseModel):
     """Typography configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     font_family: str = "Arial, sans-serif"
     font_size: Size = Size.px(14)
     font_weight: FontWeight = FontWeight.NORMAL
     line_height: float = 1.4
     letter_spacing: Size = Size.px(0)
-    color: Color = Color("#333333")
+    color: Color = _color("#333333")
     text_align: AlignmentEnum = AlignmentEnum.LEFT
     text_decoration: Optional[str] = None
     text_transform: Optional[str] = None
@@ -176,10 +221,16 @@ class Typography(BaseModel):
             css["text-transform"] = self.text_transform
         return css
 
+    def to_css_str(self) -> str:
+        """Same declarations as to_css, joined into a single CSS string."""
+        return " ".join(f"{name}: {value};" for name, value in self.to_css().items())
+
 
 class StyleState(BaseModel):
     """Style configuration for different widget states."""
 
+    model_config = ConfigDict(frozen=True)
+
     background_color: Optional[Color] = None
     border: Optional[Border] = None
     shadow: Optional[Shadow] = None
@@ -190,19 +241,44 @@ class StyleState(BaseModel):
 
     def merge_with(self, other: StyleState) -> StyleState:
         """Merge with another style state, with other taking precedence."""
-        return StyleState(
-            background_color=other.background_color or self.background_color,
-            border=other.border or self.border,
-            shadow=other.shadow or self.shadow,
-            typography=other.typography or self.typography,
-            opacity=other.opacity if other.opacity != 1.0 else self.opacity,
-            transform=other.transform or self.transform,
-            transition=other.transition or self.transition,
-        )
+        # One pass over the field dict; opacity is handled below since its
+        # "unset" value is 1.0 rather than None
+        updates = {
+            name: value
+            for name, value in other.__dict__.items()
+            if value and name != "opacity"
+        }
+        if other.opacity != 1.0:
+            updates["opacity"] = other.opacity
+        # Both states are already validated, model_copy skips re-validation
+        return self.model_copy(update=updates) if updates else self
+
+
+# WidgetStyle state field -> Qt pseudo-state selector
+_STATE_SELECTORS: Tuple[Tuple[str, str], ...] = (
+    ("hover", ":hover"),
+    ("focus", ":focus"),
+    ("active", ":pressed"),
+    ("disabled", ":disabled"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _compile_stylesheet(widget_class: str, style: WidgetStyle) -> str:
+    """Compile a stylesheet once per (widget class, style content)."""
+    return style._build_stylesheet(widget_class)
 
 
 class WidgetStyle(BaseModel):
-    """Complete widget style configuration."""
+    """Complete widget style configuration.
+
+    Styles, like every model they are built from, are immutable: hashing and
+    equality go through a fingerprint computed once per instance, so
+    comparing two styles is a string compare instead of a recursive field
+    walk. Use ``model_copy(update=...)`` to derive a modified style.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     normal: StyleState = Field(default_factory=StyleState)
     hover: Optional[StyleState] = None
@@ -218,36 +294,76 @@ class WidgetStyle(BaseModel):
     max_width: Optional[Size] = None
     max_height: Optional[Size] = None
 
+    _fingerprint_cache: Optional[str] = PrivateAttr(default=None)
+
+    def __hash__(self) -> int:
+        return hash(self._fingerprint())
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, WidgetStyle):
+            return NotImplemented
+        return self._fingerprint() == other._fingerprint()
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> WidgetStyle:
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            # The copied fingerprint describes the original content
+            copy._fingerprint_cache = None
+        return copy
+
     def get_state_style(self, state: str = "normal") -> StyleState:
         """Get style for specific state."""
         state_style = getattr(self, state, None) or self.normal
         return self.normal.merge_with(state_style) if state != "normal" else state_style
 
     def to_stylesheet(self, widget_class: str = "QWidget") -> str:
-        """Generate Qt stylesheet from style configuration."""
+        """Generate Qt stylesheet from style configuration.
+
+        The result is cached per widget class and style content, so only the
+        first widget sharing a given style pays for the generation.
+        """
+        return _compile_stylesheet(widget_class, self)
+
+    def _fingerprint(self) -> str:
+        """Serialized style content, computed once per instance."""
+        fingerprint = self._fingerprint_cache
+        if fingerprint is None:
+            fingerprint = self._fingerprint_cache = self.model_dump_json()
+        return fingerprint
+
+    def _build_stylesheet(self, widget_class: str) -> str:
+        """Build the Qt stylesheet without consulting the cache."""
         css_parts = []
+        box_css = self._box_css()
 
         # Normal state
-        normal_css = self._state_to_css(self.normal)
+        normal_css = self._state_to_css(self.normal, box_css)
         if normal_css:
             css_parts.append(f"{widget_class} {{ {normal_css} }}")
 
         # Other states
-        for state_name, qt_selector in [
-            ("hover", ":hover"),
-            ("focus", ":focus"),
-            ("active", ":pressed"),
-            ("disabled", ":disabled"),
-        ]:
+        for state_name, qt_selector in _STATE_SELECTORS:
             state_style = getattr(self, state_name)
             if state_style:
-                state_css = self._state_to_css(state_style)
+                state_css = self._state_to_css(state_style, box_css)
                 if state_css:
                     css_parts.append(f"{widget_class}{qt_selector} {{ {state_css} }}")
 
         return "\n".join(css_parts)
 
-    def _state_to_css(self, state: StyleState) -> str:
+    def _box_css(self) -> str:
+        """Padding and margin declarations, shared by every state."""
+        p, m = self.padding, self.margin
+        return (
+            f"padding: {p.top} {p.right} {p.bottom} {p.left}; "
+            f"margin: {m.top} {m.right} {m.bottom} {m.left};"
+        )
+
+    def _state_to_css(self, state: StyleState, box_css: str) -> str:
         """Convert style state to CSS string."""
         css_parts = []
 
@@ -261,8 +377,7 @@ class WidgetStyle(BaseModel):
             css_parts.append(f"box-shadow: {state.shadow.to_css()};")
 
         if state.typography:
-            for prop, value in state.typography.to_css().items():
-                css_parts.append(f"{prop}: {value};")
+            css_parts.append(state.typography.to_css_str())
 
         if state.opacity != 1.0:
             css_parts.append(f"opacity: {state.opacity};")
@@ -274,16 +389,15 @@ class WidgetStyle(BaseModel):
             css_parts.append(f"transition: {state.transition};")
 
         # Add padding and margin
-        css_parts.append(
-            f"padding: {self.padding.top} {self.padding.right} {self.padding.bottom} {self.padding.left};"
-        )
-        css_parts.append(
-            f"margin: {self.margin.top} {self.margin.right} {self.margin.bottom} {self.margin.left};"
-        )
+        css_parts.append(box_css)
 
         return " ".join(css_parts)
 
 
+# Styles are frozen, so every config without an explicit style can share one
+_DEFAULT_WIDGET_STYLE = WidgetStyle()
+
+
 # =============================================================================
 # Widget Configuration Models
 # =============================================================================
@@ -298,7 +412,7 @@ class BaseWidgetConfig(BaseModel):
     tooltip: Optional[str] = None
     visible: bool = True
     disabled: bool = False
-    style: WidgetStyle = Field(default_factory=WidgetStyle)
+    style: WidgetStyle = Field(default_factory=lambda: _DEFAULT_WIDGET_STYLE)
 
     class Config:
         arbitrary_types_allowed = True
@@ -480,23 +594,25 @@ class ComboBoxConfig(FormFieldConfig):
 class ThemeConfig(BaseModel):
     """Theme configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Optional[str] = None
 
     # Color palette
-    primary_color: Color = Color("#007bff")
-    secondary_color: Color = Color("#6c757d")
-    success_color: Color = Color("#28a745")
-    warning_color: Color = Color("#ffc107")
-    error_color: Color = Color("#dc3545")
-    info_color: Color = Color("#17a2b8")
+    primary_color: Color = _color("#007bff")
+    secondary_color: Color = _color("#6c757d")
+    success_color: Color = _color("#28a745")
+    warning_color: Color = _color("#ffc107")
+    error_color: Color = _color("#dc3545")
+    info_color: Color = _color("#17a2b8")
 
     # Neutral colors
-    background_color: Color = Color("#ffffff")
-    surface_color: Color = Color("#f8f9fa")
-    text_color: Color = Color("#212529")
-    text_muted_color: Color = Color("#6c757d")
-    border_color: Color = Color("#dee2e6")
+    background_color: Color = _color("#ffffff")
+    surface_color: Color = _color("#f8f9fa")
+    text_color: Color = _color("#212529")
+    text_muted_color: Color = _color("#6c757d")
+    border_color: Color = _color("#dee2e6")
 
     # Typography
     font_family_primary: str = "Inter, -apple-system, BlinkMacSystemFont, sans-serif"
@@ -525,25 +641,83 @@ class ThemeConfig(BaseModel):
 
     # Shadows
     shadow_sm: Shadow = Field(
-        default_factory=lambda: Shadow(
-            y=Size.px(1), blur=Size.px(3), color=Color("rgba(0, 0, 0, 0.1)")
+        default_factory=lambda: Shadow.model_construct(
+            y=Size.px(1), blur=Size.px(3), color=_color("rgba(0, 0, 0, 0.1)")
         )
     )
     shadow_md: Shadow = Field(
-        default_factory=lambda: Shadow(
-            y=Size.px(4), blur=Size.px(6), color=Color("rgba(0, 0, 0, 0.1)")
+        default_factory=lambda: Shadow.model_construct(
+            y=Size.px(4), blur=Size.px(6), color=_color("rgba(0, 0, 0, 0.1)")
         )
     )
     shadow_lg: Shadow = Field(
-        default_factory=lambda: Shadow(
-            y=Size.px(10), blur=Size.px(15), color=Color("rgba(0, 0, 0, 0.1)")
+        default_factory=lambda: Shadow.model_construct(
+            y=Size.px(10), blur=Size.px(15), color=_color("rgba(0, 0, 0, 0.1)")
         )
     )
 
+    _style_cache: Dict[Tuple[str, str], WidgetStyle] = PrivateAttr(
+        default_factory=dict
+    )
+
+    # Variant lookup tables; theme-dependent entries name the field to read
+    _BUTTON_COLOR_FIELDS: ClassVar[Dict[str, str]] = {
+        "primary": "primary_color",
+        "secondary": "secondary_color",
+        "success": "success_color",
+        "warning": "warning_color",
+        "error": "error_color",
+    }
+    _TEXT_SIZE_FIELDS: ClassVar[Dict[str, str]] = {
+        "heading": "font_size_xl",
+        "subheading": "font_size_lg",
+        "body": "font_size_md",
+        "caption": "font_size_sm",
+        "overline": "font_size_xs",
+    }
+    _TEXT_WEIGHTS: ClassVar[Dict[str, FontWeight]] = {
+        "heading": FontWeight.BOLD,
+        "subheading": FontWeight.MEDIUM,
+        "body": FontWeight.NORMAL,
+        "caption": FontWeight.NORMAL,
+        "overline": FontWeight.MEDIUM,
+    }
+
+    def __eq__(self, other: object) -> bool:
+        # Compare the fields only: the default also compares the private
+        # attributes, which would make equality depend on _style_cache
+        if self is other:
+            return True
+        if not isinstance(other, ThemeConfig):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> ThemeConfig:
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            # Styles cached by the original theme no longer match the copy
+            copy._style_cache = {}
+        return copy
+
     def get_widget_style(
         self, widget_type: str, variant: str = "default"
     ) -> WidgetStyle:
-        """Get predefined style for widget type and variant."""
+        """Get predefined style for widget type and variant.
+
+        Styles are immutable, so each one is built once per theme and shared
+        by every widget asking for the same type and variant.
+        """
+        key = (widget_type, variant)
+        style = self._style_cache.get(key)
+        if style is None:
+            style = self._build_widget_style(widget_type, variant)
+            self._style_cache[key] = style
+        return style
+
+    def _build_widget_style(self, widget_type: str, variant: str) -> WidgetStyle:
+        """Build the predefined style for widget type and variant."""
         if widget_type == "button":
             return self._get_button_style(variant)
         elif widget_type == "text_field":
@@ -555,35 +729,30 @@ class ThemeConfig(BaseModel):
 
     def _get_button_style(self, variant: str = "primary") -> WidgetStyle:
         """Get button style based on variant."""
-        color_map = {
-            "primary": self.primary_color,
-            "secondary": self.secondary_color,
-            "success": self.success_color,
-            "warning": self.warning_color,
-            "error": self.error_color,
-        }
-
-        bg_color = color_map.get(variant, self.primary_color)
+        bg_color = getattr(
+            self, self._BUTTON_COLOR_FIELDS.get(variant, "primary_color")
+        )
 
-        return WidgetStyle(
-            normal=StyleState(
+        # Theme values are validated when the theme is built
+        return WidgetStyle.model_construct(
+            normal=StyleState.model_construct(
                 background_color=bg_color,
-                border=Border(
+                border=Border.model_construct(
                     width=Size.px(1), color=bg_color, radius=self.border_radius_md
                 ),
-                typography=Typography(
-                    color=Color("#ffffff"),
+                typography=Typography.model_construct(
+                    color=_color("#ffffff"),
                     font_weight=FontWeight.MEDIUM,
                     text_align=AlignmentEnum.CENTER,
                 ),
             ),
-            hover=StyleState(
-                background_color=Color(f"rgba({bg_color.as_rgb()}, 0.9)"),
+            hover=StyleState.model_construct(
+                background_color=_with_alpha(bg_color, 0.9),
                 transform="translateY(-1px)",
                 shadow=self.shadow_md,
             ),
-            active=StyleState(
-                background_color=Color(f"rgba({bg_color.as_rgb()}, 0.8)"),
+            active=StyleState.model_construct(
+                background_color=_with_alpha(bg_color, 0.8),
                 transform="translateY(0px)",
             ),
             padding=Spacing.symmetric(vertical=12, horizontal=24),
@@ -591,31 +760,32 @@ class ThemeConfig(BaseModel):
 
     def _get_text_field_style(self, variant: str = "default") -> WidgetStyle:
         """Get text field style."""
-        return WidgetStyle(
-            normal=StyleState(
+        # Theme values are validated when the theme is built
+        return WidgetStyle.model_construct(
+            normal=StyleState.model_construct(
                 background_color=self.background_color,
-                border=Border(
+                border=Border.model_construct(
                     width=Size.px(1),
                     color=self.border_color,
                     radius=self.border_radius_md,
                 ),
-                typography=Typography(
+                typography=Typography.model_construct(
                     font_family=self.font_family_primary,
                     font_size=self.font_size_md,
                     color=self.text_color,
                 ),
             ),
-            focus=StyleState(
-                border=Border(
+            focus=StyleState.model_construct(
+                border=Border.model_construct(
                     width=Size.px(2),
                     color=self.primary_color,
                     radius=self.border_radius_md,
                 ),
-                shadow=Shadow(
+                shadow=Shadow.model_construct(
                     y=Size.px(0),
                     blur=Size.px(0),
                     spread=Size.px(3),
-                    color=Color(f"rgba({self.primary_color.as_rgb()}, 0.1)"),
+                    color=_with_alpha(self.primary_color, 0.1),
                 ),
             ),
             padding=Spacing.symmetric(vertical=10, horizontal=12),
@@ -623,28 +793,15 @@ class ThemeConfig(BaseModel):
 
     def _get_text_style(self, variant: str = "body") -> WidgetStyle:
         """Get text style based on variant."""
-        size_map = {
-            "heading": self.font_size_xl,
-            "subheading": self.font_size_lg,
-            "body": self.font_size_md,
-            "caption": self.font_size_sm,
-            "overline": self.font_size_xs,
-        }
-
-        weight_map = {
-            "heading": FontWeight.BOLD,
-            "subheading": FontWeight.MEDIUM,
-            "body": FontWeight.NORMAL,
-            "caption": FontWeight.NORMAL,
-            "overline": FontWeight.MEDIUM,
-        }
-
-        return WidgetStyle(
-            normal=StyleState(
-                typography=Typography(
+        # Theme values are validated when the theme is built
+        return WidgetStyle.model_construct(
+            normal=StyleState.model_construct(
+                typography=Typography.model_construct(
                     font_family=self.font_family_primary,
-                    font_size=size_map.get(variant, self.font_size_md),
-                    font_weight=weight_map.get(variant, FontWeight.NORMAL),
+                    font_size=getattr(
+                        self, self._TEXT_SIZE_FIELDS.get(variant, "font_size_md")
+                    ),
+                    font_weight=self._TEXT_WEIGHTS.get(variant, FontWeight.NORMAL),
                     color=self.text_color,
                 )
             )
@@ -662,36 +819,39 @@ class Themes:
     @staticmethod
     def light() -> ThemeConfig:
         """Light theme configuration."""
-        return ThemeConfig(
+        # trusted: literal theme values
+        return ThemeConfig.model_construct(
             name="light", description="Clean light theme with modern aesthetics"
         )
 
     @staticmethod
     def dark() -> ThemeConfig:
         """Dark theme configuration."""
-        return ThemeConfig(
+        # trusted: literal theme values
+        return ThemeConfig.model_construct(
             name="dark",
             description="Modern dark theme",
-            background_color=Color("#1a1a1a"),
-            surface_color=Color("#2d2d2d"),
-            text_color=Color("#ffffff"),
-            text_muted_color=Color("#a0a0a0"),
-            border_color=Color("#404040"),
+            background_color=_color("#1a1a1a"),
+            surface_color=_color("#2d2d2d"),
+            text_color=_color("#ffffff"),
+            text_muted_color=_color("#a0a0a0"),
+            border_color=_color("#404040"),
         )
 
     @staticmethod
     def material() -> ThemeConfig:
         """Material Design inspired theme."""
-        return ThemeConfig(
+        # trusted: literal theme values
+        return ThemeConfig.model_construct(
             name="material",
             description="Material Design inspired theme",
-            primary_color=Color("#1976d2"),
-            secondary_color=Color("#dc004e"),
+            primary_color=_color("#1976d2"),
+            secondary_color=_color("#dc004e"),
             border_radius_md=Size.px(4),
-            shadow_md=Shadow(
+            shadow_md=Shadow.model_construct(
                 y=Size.px(2),
                 blur=Size.px(4),
                 spread=Size.px(1),
-                color=Color("rgba(0, 0, 0, 0.2)"),
+                color=_color("rgba(0, 0, 0, 0.2)"),
             ),
         )
@@ -14,17 +14,14 @@ class RegistrationCodeController(BaseController):
         Returns (is_valid, user_type)
         """
         try:
-            codes = self.find_by_attributes(code=code, is_used=False)
+            # Expired codes are filtered out by the query itself
+            codes = self.find_by_attributes(
+                code=code, is_used=False, expiration_date__gte=datetime.now()
+            )
             if not codes:
                 return False, None
                 
-            reg_code = codes[0]
-            
-            # Check if code is expired
-            if reg_code.expiration_date < datetime.now():
-                return False, None
-                
-            return True, reg_code.user_type
+            return True, codes[0].user_type
             
         except Exception:
             return False, None
@@ -32,12 +29,17 @@ class RegistrationCodeController(BaseController):
     def mark_code_as_used(self, code: str) -> bool:
         """Mark registration code as used"""
         try:
-            codes = self.find_by_attributes(code=code)
-            if not codes:
-                return False
-                
-            reg_code = codes[0]
-            return self.update(reg_code.id, is_used=True)
-            
+            # Conditional update: one round-trip, and only one caller gets
+            # True for a given code, so claim it before creating the account
+            return self.update_where({"code": code, "is_used": False}, is_used=True) > 0
+
+        except Exception:
+            return False
+
+    def release_code(self, code: str) -> bool:
+        """Make a code claimed by mark_code_as_used available again"""
+        try:
+            return self.update_where({"code": code, "is_used": True}, is_used=False) > 0
+
         except Exception:
             return False
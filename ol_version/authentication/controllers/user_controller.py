@@ -1,7 +1,6 @@
 from datetime import datetime
-from typing import Optional, Tuple
-import bcrypt
-import re
+from typing import List, Optional, Tuple
+import string
 from ..models.user_model import UserModel, UserType
 from ...controllers.base_controller import BaseController
 
@@ -13,10 +12,32 @@ class AuthController(BaseController):
     # Password validation constants
     MIN_LENGTH = 8
     MAX_LENGTH = 50
+
+    # bcrypt cost factor (log2 of the number of key-expansion rounds)
+    BCRYPT_ROUNDS = 12
+    # Hash compared against on failed lookups, built on first use
+    _dummy_hash: Optional[bytes] = None
+
+    # Character classes, built once and matched against the set of characters
+    # in the password instead of rescanning it with a regex per criterion
+    _UPPERCASE = frozenset(string.ascii_uppercase)
+    _LOWERCASE = frozenset(string.ascii_lowercase)
+    _DIGITS = frozenset(string.digits)
+    _SPECIAL = frozenset(" !@\"#$%&'()*+,-./[\\]^_`{|}~")
     
     def __init__(self):
         super().__init__(UserModel)
 
+    @classmethod
+    def instance(cls) -> "AuthController":
+        """Shared controller instance, created on first use"""
+        # Looked up on cls itself so a subclass gets its own instance
+        controller = cls.__dict__.get("_instance")
+        if controller is None:
+            controller = cls()
+            cls._instance = controller
+        return controller
+
     def _validate_password(self, password: str) -> Tuple[bool, Optional[str]]:
         """
         Validate password against security criteria.
@@ -38,42 +59,54 @@ class AuthController(BaseController):
         if not self.MIN_LENGTH <= len(password) <= self.MAX_LENGTH:
             return False, f"Password must be between {self.MIN_LENGTH} and {self.MAX_LENGTH} characters"
 
+        chars = set(password)
+
         # Check for uppercase
-        if not re.search(r'[A-Z]', password):
+        if chars.isdisjoint(self._UPPERCASE):
             return False, "Password must contain at least one uppercase letter"
 
         # Check for lowercase
-        if not re.search(r'[a-z]', password):
+        if chars.isdisjoint(self._LOWERCASE):
             return False, "Password must contain at least one lowercase letter"
 
         # Check for digits
-        if not re.search(r'\d', password):
+        if chars.isdisjoint(self._DIGITS):
             return False, "Password must contain at least one digit"
 
         # Check for special characters
-        if not re.search(r'[ !@#$%&\'()*+,-./[\\\]^_`{|}~"]', password):
+        if chars.isdisjoint(self._SPECIAL):
             return False, "Password must contain at least one special character"
 
         return True, None
 
     def _hash_password(self, password: str) -> str:
         """Hash a password using bcrypt"""
+        import bcrypt  # deferred: only the password paths need it
         # Convert the password to bytes
         password_bytes = password.encode('utf-8')
         # Generate a salt and hash the password
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self.BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password_bytes, salt)
         # Return the hashed password as string
         return hashed.decode('utf-8')
 
     def _check_password(self, password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
+        import bcrypt
         # Convert strings to bytes
         password_bytes = password.encode('utf-8')
         hashed_bytes = hashed_password.encode('utf-8')
         # Check the password
         return bcrypt.checkpw(password_bytes, hashed_bytes)
 
+    def _burn_password_check(self, password: str) -> None:
+        """Run a bcrypt check that always fails, so unknown users cost as much as known ones"""
+        import bcrypt
+        cls = type(self)
+        if cls._dummy_hash is None:
+            cls._dummy_hash = bcrypt.hashpw(b"dummy", bcrypt.gensalt(rounds=self.BCRYPT_ROUNDS))
+        bcrypt.checkpw(password.encode('utf-8'), cls._dummy_hash)
+
     def create_user(
         self,
         username: str,
@@ -105,20 +138,61 @@ class AuthController(BaseController):
             PasswordValidationError: If password doesn't meet security criteria
         """
         try:
-            # Validate password
-            is_valid, error_message = self._validate_password(password)
-            if not is_valid:
-                raise PasswordValidationError(error_message)
+            hashed_password, hashed_answer = self.hash_credentials(password, secret_answer)
+        except PasswordValidationError:
+            raise
+        except Exception:
+            return None
+
+        return self.create_hashed_user(
+            username=username,
+            email=email,
+            hashed_password=hashed_password,
+            secret_question=secret_question,
+            hashed_answer=hashed_answer,
+            first_name=first_name,
+            last_name=last_name,
+            user_type=user_type,
+        )
+
+    def hash_credentials(self, password: str, secret_answer: str) -> Tuple[str, str]:
+        """
+        Validate the password, then hash it along with the secret answer.
+        
+        Only runs bcrypt, without any database access, so it can be called
+        from a worker thread.
+        
+        Returns:
+            Tuple[str, str]: (hashed_password, hashed_answer)
+            
+        Raises:
+            PasswordValidationError: If password doesn't meet security criteria
+        """
+        return self.hash_new_password(password), self._hash_password(secret_answer.lower())
 
+    def create_hashed_user(
+        self,
+        username: str,
+        email: str,
+        hashed_password: str,
+        secret_question: str,
+        hashed_answer: str,
+        first_name: str = None,
+        last_name: str = None,
+        user_type: UserType = UserType.DEFAULT,
+    ) -> Optional[UserModel]:
+        """
+        Create a new user from credentials hashed by hash_credentials.
+        
+        Returns:
+            Optional[UserModel]: Created user or None if the username or email
+            is taken or creation fails
+        """
+        try:
             # Check if username or email exists
-            if self.exists(username=username) or self.exists(email=email):
+            if self.exists_any(username=username, email=email):
                 return None
 
-            # Hash password and secret answer
-            hashed_password = self._hash_password(password)
-            hashed_answer = self._hash_password(secret_answer.lower())
-
-            # Create user
             return self.create(
                 username=username,
                 email=email,
@@ -130,8 +204,6 @@ class AuthController(BaseController):
                 user_type=user_type,
                 date_joined=datetime.now(),
             )
-        except PasswordValidationError:
-            raise
         except Exception:
             return None
 
@@ -150,32 +222,53 @@ class AuthController(BaseController):
             PasswordValidationError: If new password doesn't meet security criteria
         """
         try:
-            # Validate new password
-            is_valid, error_message = self._validate_password(new_password)
-            if not is_valid:
-                raise PasswordValidationError(error_message)
+            hashed_password = self.hash_new_password(new_password)
+        except PasswordValidationError:
+            raise
+        except Exception:
+            return False
+        return self.set_password_hash(user_id, hashed_password)
 
-            # Hash and update password
-            hashed_password = self._hash_password(new_password)
+    def hash_new_password(self, new_password: str) -> str:
+        """
+        Validate a new password and hash it (bcrypt only, safe in a worker thread)
+        
+        Raises:
+            PasswordValidationError: If the password doesn't meet security criteria
+        """
+        is_valid, error_message = self._validate_password(new_password)
+        if not is_valid:
+            raise PasswordValidationError(error_message)
+        return self._hash_password(new_password)
+
+    def set_password_hash(self, user_id: int, hashed_password: str) -> bool:
+        """Store a password hashed by hash_new_password, True if successful"""
+        try:
             self.update(user_id, password=hashed_password)
             return True
-        except PasswordValidationError:
-            raise
         except Exception:
             return False
         
+    def find_by_identifier(self, identifier: str) -> List[UserModel]:
+        """Find users whose username or email is the identifier, in a single query"""
+        return self.find_any(username=identifier, email=identifier)
+
     def verify_secret_answer(self, username: str, answer: str) -> bool:
         """Verify user's secret answer"""
         try:
-            user = self.find_by_attributes(username=username)
-            if not user:
-                return False
-
-            user = user[0]
-            return self._check_password(answer.lower(), user.secret_answer)
+            return self.check_secret_answer(answer, self.get_secret_answer_hash(username))
         except Exception:
             return False
 
+    def get_secret_answer_hash(self, username: str) -> Optional[str]:
+        """Hashed secret answer of a user, None if the username is unknown"""
+        users = self.find_by_attributes(username=username)
+        return users[0].secret_answer if users else None
+
+    def check_secret_answer(self, answer: str, hashed_answer: Optional[str]) -> bool:
+        """Check an answer against get_secret_answer_hash (bcrypt only, safe in a worker thread)"""
+        return self.check_password_hash(answer.lower(), hashed_answer)
+
     def update_last_login(self, user_id: int) -> bool:
         """Update user's last login timestamp"""
         try:
@@ -198,19 +291,8 @@ class AuthController(BaseController):
                 - Optional[UserModel]: The authenticated user or None if authentication failed
         """
         try:
-            # Find user by username
-            user = self.find_by_attributes(username=username)
-            if not user:
-                return False, None
-                
-            user = user[0]  # Get first user since username is unique
-            
-            # Check if user is active
-            if not user.is_active:
-                return False, None
-                
-            # Verify password
-            if self._check_password(password, user.password):
+            user = self.find_active_user(username)
+            if self.check_password_hash(password, user.password if user else None):
                 # Update last login timestamp
                 self.update_last_login(user.id)
                 return True, user
@@ -219,6 +301,27 @@ class AuthController(BaseController):
             
         except Exception as e:
             return False, None
+
+    def find_active_user(self, username: str) -> Optional[UserModel]:
+        """User with this username, None if it is unknown or inactive"""
+        users = self.find_by_attributes(username=username)
+        if users and users[0].is_active:  # username is unique
+            return users[0]
+        return None
+
+    def check_password_hash(self, password: str, hashed_password: Optional[str]) -> bool:
+        """
+        Verify a password against a stored hash.
+        
+        Only runs bcrypt, without any database access, so it can be called
+        from a worker thread; read the hash on the GUI thread beforehand.
+        A missing hash still pays for one bcrypt check, so response time
+        does not reveal whether the user exists.
+        """
+        if hashed_password is None:
+            self._burn_password_check(password)
+            return False
+        return self._check_password(password, hashed_password)
     
     def is_admin(self, user_id: int) -> bool:
         """Check if user is admin"""
@@ -0,0 +1,177 @@
+from typing import Callable, Optional, Set
+
+from ..controllers.user_controller import AuthController
+from ...core.commons import (
+    QWidget,
+    QDialog,
+    QHBoxLayout,
+    Qt,
+    QVBoxLayout,
+    QPoint,
+    QTimer
+)
+from ...components.image_widget import ImageWidget
+from ..themes.auth_forms_themes import FormTheme, FormThemes, FormType, is_app_theme
+
+# Forms opened through show_next_form, kept alive until they are closed
+_open_forms: Set[QDialog] = set()
+
+
+def show_next_form(current: QDialog, factory: Callable[[], QDialog]) -> None:
+    """
+    Replace the current form with the one built by factory
+    Args:
+        current: Form to close once the next one is shown
+        factory: Builds the next form (imports included)
+
+    The next form is built from the event loop rather than inside the click
+    handler, so the click is processed and repainted first. It is shown
+    before the current form closes so the application never runs out of
+    windows in between.
+    """
+    def _open():
+        form = factory()
+        _open_forms.add(form)
+        form.finished.connect(lambda *_: _open_forms.discard(form))
+        form.show()
+        current.close()
+
+    QTimer.singleShot(0, _open)
+
+
+class DraggableDialogMixin:
+    """
+    Lets a frameless dialog be dragged with the left mouse button.
+
+    Mouse samples only record the target position; the window is moved once
+    per event-loop pass by a zero-interval single-shot timer, so a burst of
+    samples from a high-rate mouse results in a single move(). Moves shorter
+    than DRAG_THRESHOLD pixels are not scheduled at all; the final position
+    is still applied on release.
+    """
+
+    DRAG_THRESHOLD: int = 2
+
+    _dragging: bool = False
+    _drag_position: QPoint = QPoint()
+    _pending_pos: QPoint = QPoint()
+    _drag_timer: Optional[QTimer] = None
+
+    def mousePressEvent(self, event):
+        """Gérer le clic de souris pour commencer le déplacement"""
+        if event.button() == Qt.LeftButton:
+            self._dragging = True
+            self._drag_position = event.globalPosition().toPoint() - self.pos()
+            self._pending_pos = self.pos()
+            event.accept()
+
+    def mouseMoveEvent(self, event):
+        """Gérer le déplacement de la fenêtre"""
+        if event.buttons() & Qt.LeftButton and self._dragging:
+            self._pending_pos = event.globalPosition().toPoint() - self._drag_position
+            if (self._pending_pos - self.pos()).manhattanLength() < self.DRAG_THRESHOLD:
+                event.accept()
+                return  # no visible movement, skip the window-manager round-trip
+            if self._drag_timer is None:
+                self._drag_timer = QTimer(self)
+                self._drag_timer.setSingleShot(True)
+                self._drag_timer.setInterval(0)
+                self._drag_timer.timeout.connect(self._apply_drag)
+            if not self._drag_timer.isActive():
+                self._drag_timer.start()
+            event.accept()
+
+    def mouseReleaseEvent(self, event):
+        """Gérer le relâchement du clic pour arrêter le déplacement"""
+        if event.button() == Qt.LeftButton:
+            if self._dragging:
+                self._dragging = False
+                if self._drag_timer is not None:
+                    self._drag_timer.stop()
+                # Land exactly where the button was released
+                self._apply_drag()
+            event.accept()
+
+    def _apply_drag(self):
+        if self._pending_pos != self.pos():
+            self.move(self._pending_pos)
+
+
+class AuthFormBase(DraggableDialogMixin, QDialog):
+    """
+    Shared scaffolding of the authentication forms: a frameless dialog with
+    the illustration on the left and the form column on the right.
+
+    Subclasses set the class attributes below, call super().__init__, add
+    their widgets to self.form_layout and finish with self._finalize().
+    """
+
+    OBJECT_NAME: str = ""
+    FORM_TYPE: FormType = FormType.LOGIN
+    IMAGE_ASSET: str = ""
+    FORM_WIDTH: int = 800
+    FORM_SPACING: int = 20
+
+    _stylesheet: Optional[str] = None
+
+    def __init__(self, theme: Optional[FormTheme] = None, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+        self._dragging = False
+        self._drag_position = QPoint()
+        self.setObjectName(self.OBJECT_NAME)
+        self.setFixedWidth(self.FORM_WIDTH)
+        # Hold repaints and layout passes until _finalize(), so the fields
+        # added by the subclass are laid out and polished in a single pass
+        self.setUpdatesEnabled(False)
+
+        self.auth_controller = AuthController.instance()
+        self.theme = theme or FormThemes.LIGHT
+
+        # Main layout
+        self.main_layout = QHBoxLayout(self)
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.setSpacing(0)
+        self.main_layout.setEnabled(False)
+
+        # Image section
+        self.image_container = QWidget()
+        self.image_container.setFixedWidth(400)
+        self.image_container.setObjectName("image-container")
+        self.image_layout = QVBoxLayout(self.image_container)
+        self.image = ImageWidget(
+            self.IMAGE_ASSET,
+            width=400,
+            height=600,
+            keep_aspect_ratio=True
+        )
+        self.image_layout.addWidget(self.image)
+        self.main_layout.addWidget(self.image_container)
+
+        # Form container
+        self.form_container = QWidget()
+        self.form_layout = QVBoxLayout(self.form_container)
+        self.form_layout.setContentsMargins(30, 30, 30, 30)
+        self.form_layout.setSpacing(self.FORM_SPACING)
+
+    def _finalize(self):
+        """Attach the form column and apply the theme once the fields are built"""
+        self.main_layout.addWidget(self.form_container)
+        self.apply_theme()
+        self.main_layout.setEnabled(True)
+        self.setUpdatesEnabled(True)
+
+    def show_error(self, message: str):
+        """Display error message"""
+        self.error_message.setText(message)
+        self.error_message.show()
+
+    def apply_theme(self):
+        """Apply current theme to form"""
+        if is_app_theme(self.theme):
+            return  # covered by the application stylesheet
+        stylesheet = self.theme.get_stylesheet(form_type=self.FORM_TYPE)
+        if stylesheet == self._stylesheet:
+            return  # unchanged, spare Qt a full re-polish
+        self._stylesheet = stylesheet
+        self.setStyleSheet(stylesheet)
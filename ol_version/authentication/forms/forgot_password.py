@@ -1,25 +1,22 @@
 from typing import Optional
 
-from ..controllers.user_controller import AuthController
 from ...core.commons import (
-    QWidget,
     QDialog,
+    QWidget,
     QHBoxLayout,
     Qt,
-    QVBoxLayout,
-    QPoint,
     Signal
 )
 from ...widgets.text import Text
 from ...widgets.text_field import TextField
 from ...widgets.button import Button
-from ...components.image_widget import ImageWidget
 
 from ...widgets.themes.button_themes import ButtonThemes
 from ...widgets.themes.text_themes import TextThemes
-from ..themes.auth_forms_themes import FormTheme, FormThemes, FormType
+from ..themes.auth_forms_themes import FormTheme, FormType
+from ._base import AuthFormBase, show_next_form
 
-class ForgotPasswordForm(QDialog):
+class ForgotPasswordForm(AuthFormBase):
     """
     Forgot password form step 1: Identifier verification
     """
@@ -28,41 +25,19 @@ class ForgotPasswordForm(QDialog):
     verify_failed = Signal(str)      # Emits error message
     show_login_form = Signal()       # Signal to switch back to login
     
-    def __init__(self, theme: Optional[FormTheme] = None, parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self._dragging = False
-        self._drag_position = QPoint()
-        self.setObjectName("forgot-password-form")
-        self.setFixedWidth(800)
-        
-        self.auth_controller = AuthController()
-        self.theme = theme or FormThemes.LIGHT
-        
-        # Main layout
-        self.main_layout = QHBoxLayout(self)
-        self.main_layout.setContentsMargins(0, 0, 0, 0)
-        self.main_layout.setSpacing(0)
-        
-        # Image section
-        self.image_container = QWidget()
-        self.image_container.setFixedWidth(400)
-        self.image_container.setObjectName("image-container")
-        self.image_layout = QVBoxLayout(self.image_container)
-        self.image = ImageWidget(
-            "ksb_pyside_kit/assets/forgot_password.png",
-            width=400,
-            height=600,
-            keep_aspect_ratio=True
-        )
-        self.image_layout.addWidget(self.image)
-        self.main_layout.addWidget(self.image_container)
-        
-        # Form container
-        self.form_container = QWidget()
-        self.form_layout = QVBoxLayout(self.form_container)
-        self.form_layout.setContentsMargins(30, 30, 30, 30)
-        self.form_layout.setSpacing(20)
+    OBJECT_NAME = "forgot-password-form"
+    FORM_TYPE = FormType.FORGOT_PASSWORD
+    IMAGE_ASSET = "ksb_pyside_kit/assets/forgot_password.png"
+
+    def __init__(
+        self,
+        theme: Optional[FormTheme] = None,
+        parent: Optional[QWidget] = None,
+        login_form: Optional[QDialog] = None
+    ):
+        super().__init__(theme=theme, parent=parent)
+        # Formulaire de connexion d'origine, transmis jusqu'à la réinitialisation
+        self.login_form = login_form
         
         # Title
         self.title = Text(
@@ -121,11 +96,7 @@ class ForgotPasswordForm(QDialog):
         self.error_message.hide()
         self.form_layout.addWidget(self.error_message)
         
-        self.main_layout.addWidget(self.form_container)
-        self.setLayout(self.main_layout)
-        
-        # Apply theme
-        self.apply_theme()
+        self._finalize()
     
     def handle_verify(self):
         """Verify identifier and proceed to next step"""
@@ -137,19 +108,19 @@ class ForgotPasswordForm(QDialog):
             user = None
             
             # Search by username or email
-            if '@' in identifier:
-                users = self.auth_controller.find_by_attributes(email=identifier)
-            else:
-                users = self.auth_controller.find_by_attributes(username=identifier)
+            users = self.auth_controller.find_by_identifier(identifier)
                 
             if users:
                 user = users[0]
                 self.verify_success.emit(user)
                 # Transition to secret question form
                 from .secret_question import SecretQuestionForm
-                question_form = SecretQuestionForm(user=user)
-                question_form.show()
-                self.close()
+                show_next_form(
+                    self,
+                    lambda: SecretQuestionForm(
+                        user=user, theme=self.theme, login_form=self.login_form
+                    )
+                )
             else:
                 self.show_error("Aucun compte trouvé avec cet identifiant")
                 
@@ -161,29 +132,3 @@ class ForgotPasswordForm(QDialog):
         """Return to login form"""
         self.show_login_form.emit()
         self.close()
-    
-    def show_error(self, message: str):
-        """Display error message"""
-        self.error_message.setText(message)
-        self.error_message.show()
-        
-    def apply_theme(self):
-        """Apply current theme to form"""
-        self.setStyleSheet(self.theme.get_stylesheet(form_type=FormType.FORGOT_PASSWORD))
-
-    # Mouse event handlers for window dragging
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._dragging = True
-            self._drag_position = event.globalPos() - self.pos()
-            event.accept()
-
-    def mouseMoveEvent(self, event):
-        if event.buttons() & Qt.LeftButton and self._dragging:
-            self.move(event.globalPos() - self._drag_position)
-            event.accept()
-
-    def mouseReleaseEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._dragging = False
-            event.accept()
@@ -1,29 +1,23 @@
 from typing import Optional
 
-from ..controllers.user_controller import AuthController
-from ..models.user_model import UserType
 from ...core.commons import (
     QWidget,
-    QDialog,
     QHBoxLayout,
     Qt,
-    QCheckBox,
-    QFormLayout,
-    QVBoxLayout,
-    QPoint,
+    QTimer,
     Signal
 )
 from ...widgets.text import Text
-from ...widgets.text_field import TextField, EmailField, PasswordField
+from ...widgets.text_field import TextField, PasswordField
 from ...widgets.button import Button
-from ...widgets.combobox import ComboBox
-from ...components.image_widget import ImageWidget
 
-from ...widgets.themes.button_themes import ButtonTheme, ButtonThemes
-from ...widgets.themes.text_themes import TextTheme, TextThemes
-from ..themes.auth_forms_themes import FormTheme, FormThemes, FormType
+from ...widgets.themes.button_themes import ButtonThemes
+from ...widgets.themes.text_themes import TextThemes
+from ..themes.auth_forms_themes import FormTheme, FormType
+from ...core.utils import run_in_background
+from ._base import AuthFormBase, show_next_form
 
-class LoginForm(QDialog):
+class LoginForm(AuthFormBase):
     """
     Login form widget for authentication.
     
@@ -37,42 +31,13 @@ class LoginForm(QDialog):
     auth_failed = Signal(str)      # Emits error message
     show_register_form = Signal()  # Signal pour afficher le formulaire d'inscription
     
+    OBJECT_NAME = "auth-form"
+    FORM_TYPE = FormType.LOGIN
+    IMAGE_ASSET = "ksb_pyside_kit/assets/login.png"
+
     def __init__(self, theme: Optional[FormTheme] = None,  parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self._dragging = False
-        self._drag_position = QPoint()
-        self.setObjectName("auth-form")
-        self.setFixedWidth(800)  # Augmenter la largeur pour accommoder l'image
-        
-        # Initialize controller
-        self.auth_controller = AuthController()
-        self.theme = theme or FormThemes.LIGHT
-        
-        # Main layout horizontal
-        self.main_layout = QHBoxLayout(self)
-        self.main_layout.setContentsMargins(0, 0, 0, 0)
-        self.main_layout.setSpacing(0)
-        
-        # Image section
-        self.image_container = QWidget()
-        self.image_container.setFixedWidth(400)
-        self.image_container.setObjectName("image-container")
-        self.image_layout = QVBoxLayout(self.image_container)
-        self.login_image = ImageWidget(
-            "ksb_pyside_kit/assets/login.png",
-            width=400,
-            height=600,
-            keep_aspect_ratio=True
-        )
-        self.image_layout.addWidget(self.login_image)
-        self.main_layout.addWidget(self.image_container)
-        
-        # Form container
-        self.form_container = QWidget()
-        self.form_layout = QVBoxLayout(self.form_container)
-        self.form_layout.setContentsMargins(30, 30, 30, 30)
-        self.form_layout.setSpacing(20)
+        super().__init__(theme=theme, parent=parent)
+        self.login_image = self.image
         
         # Welcome text
         self.welcome_label = Text(value="Authentification!", theme=TextThemes.H3_PRIMARY)
@@ -108,7 +73,7 @@ class LoginForm(QDialog):
         self.forgot_password_link = Text(
             value="Mot de passe oublé?",
             theme=TextThemes.LINK,
-            on_click=lambda: print("Forgot password link clicked"),
+            on_click=self.show_forgot_password_form,
         )
         self.options_layout.addWidget(self.forgot_password_link, alignment=Qt.AlignRight)
         
@@ -161,15 +126,10 @@ class LoginForm(QDialog):
         self.signup_layout.setAlignment(Qt.AlignCenter)
         self.form_layout.addLayout(self.signup_layout)
         
-        self.main_layout.addWidget(self.form_container)
-        
-        self.setLayout(self.main_layout)
-        
         # Connect signal to handler
         self.show_register_form.connect(self.show_register_form_handler)
         
-        # Apply theme
-        self.apply_theme()
+        self._finalize()
     
     def handle_login(self):
         """Handle login attempt"""
@@ -177,31 +137,41 @@ class LoginForm(QDialog):
         if not self.username_field.is_valid() or not self.password_field.is_valid():
             return
             
+        # The user is looked up on the GUI thread (the database session is
+        # shared); only the bcrypt check, slow by design, runs in the pool
+        password = self.password_field.value
         try:
-            # Attempt authentication
-            success, user = self.auth_controller.authenticate(
-                username=self.username_field.value,
-                password=self.password_field.value
-            )
-            
-            if success:
-                # Clear form and emit success signal
-                self.clear_form()
-                self.error_message.hide()
-                self.auth_success.emit(user)
-            else:
-                # Show error
-                self.show_error("Nom d'utilisateur ou mot de passe invalide")
-                self.auth_failed.emit("Authentication failed")
-                
+            user = self.auth_controller.find_active_user(self.username_field.value)
         except Exception as e:
-            self.show_error(str(e))
-            self.auth_failed.emit(str(e))
-    
-    def show_error(self, message: str):
-        """Display error message"""
-        self.error_message.setText(message)
-        self.error_message.show()
+            self._on_login_error(e)
+            return
+        hashed_password = user.password if user else None
+        self.login_button.setEnabled(False)
+        run_in_background(
+            lambda: self.auth_controller.check_password_hash(password, hashed_password),
+            lambda valid: self._on_login_result(user if valid else None),
+            self._on_login_error
+        )
+
+    def _on_login_result(self, user):
+        """Handle the outcome of an authentication attempt"""
+        self.login_button.setEnabled(True)
+        if user is not None:
+            self.auth_controller.update_last_login(user.id)
+            # Clear form and emit success signal
+            self.clear_form()
+            self.error_message.hide()
+            self.auth_success.emit(user)
+        else:
+            # Show error
+            self.show_error("Nom d'utilisateur ou mot de passe invalide")
+            self.auth_failed.emit("Authentication failed")
+
+    def _on_login_error(self, error: Exception):
+        """Handle an error raised during authentication"""
+        self.login_button.setEnabled(True)
+        self.show_error(str(error))
+        self.auth_failed.emit(str(error))
     
     def clear_form(self):
         """Reset form to initial state"""
@@ -209,9 +179,20 @@ class LoginForm(QDialog):
         self.password_field.clear_content()
         self.error_message.hide()
     
-    def apply_theme(self):
-        """Apply current theme to form"""
-        self.setStyleSheet(self.theme.get_stylesheet(form_type=FormType.LOGIN)) 
+    def show_forgot_password_form(self):
+        """Ouvrir le formulaire de mot de passe oublié depuis la boucle d'événements"""
+        QTimer.singleShot(0, self._open_forgot_password_form)
+
+    def _open_forgot_password_form(self):
+        # Import local pour éviter les imports circulaires
+        from .forgot_password import ForgotPasswordForm
+        # Le parcours (question secrète, réinitialisation) revient à ce formulaire
+        form = ForgotPasswordForm(theme=self.theme, login_form=self)
+        form.show_login_form.connect(self.show)
+        # Gardé en vie tant que le formulaire de connexion est masqué
+        self._forgot_password_form = form
+        form.show()
+        self.hide()
 
     def switch_to_register(self):
         """Gérer la transition vers le formulaire d'inscription"""
@@ -221,10 +202,13 @@ class LoginForm(QDialog):
     def show_register_form_handler(self):
         """Gestionnaire appelé lorsque le signal show_register_form est émis"""
         from .signup import RegisterForm  # Import local pour éviter les imports circulaires
-        register_form = RegisterForm()
-        register_form.show_login_form.connect(self.show_login_form_handler)
-        register_form.show()
-        self.close()
+
+        def build_register_form():
+            register_form = RegisterForm()
+            register_form.show_login_form.connect(self.show_login_form_handler)
+            return register_form
+
+        show_next_form(self, build_register_form)
 
     @classmethod
     def show_login_form_handler(cls, theme=None, on_forgot_password=None):
@@ -232,22 +216,3 @@ class LoginForm(QDialog):
         login_form = cls(theme=theme, on_forgot_password=on_forgot_password)
         login_form.show()
         return login_form
-
-    def mousePressEvent(self, event):
-        """Gérer le clic de souris pour commencer le déplacement"""
-        if event.button() == Qt.LeftButton:
-            self._dragging = True
-            self._drag_position = event.globalPos() - self.pos()
-            event.accept()
-
-    def mouseMoveEvent(self, event):
-        """Gérer le déplacement de la fenêtre"""
-        if event.buttons() & Qt.LeftButton and self._dragging:
-            self.move(event.globalPos() - self._drag_position)
-            event.accept()
-
-    def mouseReleaseEvent(self, event):
-        """Gérer le relâchement du clic pour arrêter le déplacement"""
-        if event.button() == Qt.LeftButton:
-            self._dragging = False
-            event.accept()
\ No newline at end of file
@@ -1,67 +1,44 @@
 from typing import Optional
 
-from ..controllers.user_controller import AuthController
 from ..models.user_model import UserModel
 from ...core.commons import (
-    QWidget,
     QDialog,
+    QWidget,
     QHBoxLayout,
     Qt,
-    QVBoxLayout,
-    QPoint,
     Signal
 )
 from ...widgets.text import Text
 from ...widgets.text_field import PasswordField
 from ...widgets.button import Button
-from ...components.image_widget import ImageWidget
 
 from ...widgets.themes.button_themes import ButtonThemes
 from ...widgets.themes.text_themes import TextThemes
-from ..themes.auth_forms_themes import FormTheme, FormThemes, FormType
+from ..themes.auth_forms_themes import FormTheme, FormType
+from ...core.utils import run_in_background
+from ._base import AuthFormBase, show_next_form
 
-class ResetPasswordForm(QDialog):
+class ResetPasswordForm(AuthFormBase):
     """Formulaire de réinitialisation du mot de passe"""
     
     reset_success = Signal(object)
     reset_failed = Signal(str)
     
-    def __init__(self, user: UserModel, theme: Optional[FormTheme] = None, parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self._dragging = False
-        self._drag_position = QPoint()
-        self.setObjectName("reset-password-form")
-        self.setFixedWidth(800)
-        
+    OBJECT_NAME = "reset-password-form"
+    FORM_TYPE = FormType.RESET_PASSWORD
+    IMAGE_ASSET = "ksb_pyside_kit/assets/reset_password.png"
+
+    def __init__(
+        self,
+        user: UserModel,
+        theme: Optional[FormTheme] = None,
+        parent: Optional[QWidget] = None,
+        login_form: Optional[QDialog] = None
+    ):
+        super().__init__(theme=theme, parent=parent)
         self.user = user
-        self.auth_controller = AuthController()
-        self.theme = theme or FormThemes.LIGHT
-        
-        # Main layout
-        self.main_layout = QHBoxLayout(self)
-        self.main_layout.setContentsMargins(0, 0, 0, 0)
-        self.main_layout.setSpacing(0)
-        
-        # Image section
-        self.image_container = QWidget()
-        self.image_container.setFixedWidth(400)
-        self.image_container.setObjectName("image-container")
-        self.image_layout = QVBoxLayout(self.image_container)
-        self.image = ImageWidget(
-            "ksb_pyside_kit/assets/reset_password.png",
-            width=400,
-            height=600,
-            keep_aspect_ratio=True
-        )
-        self.image_layout.addWidget(self.image)
-        self.main_layout.addWidget(self.image_container)
-        
-        # Form container
-        self.form_container = QWidget()
-        self.form_layout = QVBoxLayout(self.form_container)
-        self.form_layout.setContentsMargins(30, 30, 30, 30)
-        self.form_layout.setSpacing(20)
+        # Formulaire de connexion d'origine, réaffiché à la fin du parcours
+        self.login_form = login_form
         
         # Title
         self.title = Text(
@@ -122,8 +99,7 @@ class ResetPasswordForm(QDialog):
         self.error_message.hide()
         self.form_layout.addWidget(self.error_message)
         
-        self.main_layout.addWidget(self.form_container)
-        self.apply_theme()
+        self._finalize()
         
     def handle_reset(self):
         """Gérer la réinitialisation du mot de passe"""
@@ -134,41 +110,31 @@ class ResetPasswordForm(QDialog):
             self.show_error("Les mots de passe ne correspondent pas")
             return
             
-        try:
-            if self.auth_controller.change_password(
-                user_id=self.user.id,
-                new_password=self.password_field.value
-            ):
-                from .login import LoginForm
-                login_form = LoginForm()
-                login_form.show()
+        # Hachage bcrypt dans le pool ; l'écriture en base reste sur le thread
+        # de l'interface (la session de base de données est partagée)
+        new_password = self.password_field.value
+        self.reset_button.setEnabled(False)
+        run_in_background(
+            lambda: self.auth_controller.hash_new_password(new_password),
+            self._on_reset_result,
+            self._on_reset_error
+        )
+
+    def _on_reset_result(self, hashed_password: str):
+        """Revenir à la connexion une fois le mot de passe changé"""
+        self.reset_button.setEnabled(True)
+        if self.auth_controller.set_password_hash(self.user.id, hashed_password):
+            self.reset_success.emit(self.user)
+            if self.login_form is not None:
+                # Revenir au formulaire de l'application, avec ses connexions
+                self.login_form.show()
                 self.close()
             else:
-                self.show_error("Échec de la réinitialisation du mot de passe")
-                
-        except Exception as e:
-            self.show_error(str(e))
-            
-    def show_error(self, message: str):
-        self.error_message.setText(message)
-        self.error_message.show()
-        
-    def apply_theme(self):
-        self.setStyleSheet(self.theme.get_stylesheet(form_type=FormType.RESET_PASSWORD))
-
-    # Mouse event handlers for window dragging
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._dragging = True
-            self._drag_position = event.globalPos() - self.pos()
-            event.accept()
-
-    def mouseMoveEvent(self, event):
-        if event.buttons() & Qt.LeftButton and self._dragging:
-            self.move(event.globalPos() - self._drag_position)
-            event.accept()
+                from .login import LoginForm
+                show_next_form(self, lambda: LoginForm(theme=self.theme))
+        else:
+            self.show_error("Échec de la réinitialisation du mot de passe")
 
-    def mouseReleaseEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._dragging = False
-            event.accept()
+    def _on_reset_error(self, error: Exception):
+        self.reset_button.setEnabled(True)
+        self.show_error(str(error))
@@ -1,67 +1,44 @@
 from typing import Optional
 
-from ..controllers.user_controller import AuthController
 from ..models.user_model import UserModel
 from ...core.commons import (
-    QWidget,
     QDialog,
+    QWidget,
     QHBoxLayout,
     Qt,
-    QVBoxLayout,
-    QPoint,
     Signal
 )
 from ...widgets.text import Text
 from ...widgets.text_field import TextField
 from ...widgets.button import Button
-from ...components.image_widget import ImageWidget
 
 from ...widgets.themes.button_themes import ButtonThemes
 from ...widgets.themes.text_themes import TextThemes
-from ..themes.auth_forms_themes import FormTheme, FormThemes, FormType
+from ..themes.auth_forms_themes import FormTheme, FormType
+from ...core.utils import run_in_background
+from ._base import AuthFormBase, show_next_form
 
-class SecretQuestionForm(QDialog):
+class SecretQuestionForm(AuthFormBase):
     """Formulaire de vérification de la question secrète"""
     
     verify_success = Signal(object)  # Émet l'utilisateur vérifié
     verify_failed = Signal(str)
     
-    def __init__(self, user: UserModel, theme: Optional[FormTheme] = None, parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self._dragging = False
-        self._drag_position = QPoint()
-        self.setObjectName("secret-question-form")
-        self.setFixedWidth(800)
-        
+    OBJECT_NAME = "secret-question-form"
+    FORM_TYPE = FormType.SECRET_QUESTION
+    IMAGE_ASSET = "ksb_pyside_kit/assets/verification.png"
+
+    def __init__(
+        self,
+        user: UserModel,
+        theme: Optional[FormTheme] = None,
+        parent: Optional[QWidget] = None,
+        login_form: Optional[QDialog] = None
+    ):
+        super().__init__(theme=theme, parent=parent)
         self.user = user
-        self.auth_controller = AuthController()
-        self.theme = theme or FormThemes.LIGHT
-        
-        # Main layout
-        self.main_layout = QHBoxLayout(self)
-        self.main_layout.setContentsMargins(0, 0, 0, 0)
-        self.main_layout.setSpacing(0)
-        
-        # Image section
-        self.image_container = QWidget()
-        self.image_container.setFixedWidth(400)
-        self.image_container.setObjectName("image-container")
-        self.image_layout = QVBoxLayout(self.image_container)
-        self.image = ImageWidget(
-            "ksb_pyside_kit/assets/verification.png",
-            width=400,
-            height=600,
-            keep_aspect_ratio=True
-        )
-        self.image_layout.addWidget(self.image)
-        self.main_layout.addWidget(self.image_container)
-        
-        # Form container
-        self.form_container = QWidget()
-        self.form_layout = QVBoxLayout(self.form_container)
-        self.form_layout.setContentsMargins(30, 30, 30, 30)
-        self.form_layout.setSpacing(20)
+        # Formulaire de connexion d'origine, réaffiché à la fin du parcours
+        self.login_form = login_form
         
         # Title
         self.title = Text(
@@ -118,49 +95,41 @@ class SecretQuestionForm(QDialog):
         self.error_message.hide()
         self.form_layout.addWidget(self.error_message)
         
-        self.main_layout.addWidget(self.form_container)
-        self.apply_theme()
+        self._finalize()
         
     def handle_verify(self):
         """Vérifier la réponse à la question secrète"""
         if not self.answer_field.is_valid():
             return
             
+        # Hash read on the GUI thread (shared database session), bcrypt in the pool
+        answer = self.answer_field.value
         try:
-            if self.auth_controller.verify_secret_answer(
-                username=self.user.username,
-                answer=self.answer_field.value
-            ):
-                from .reset_password import ResetPasswordForm
-                reset_form = ResetPasswordForm(user=self.user)
-                reset_form.show()
-                self.close()
-            else:
-                self.show_error("Réponse incorrecte")
-                
+            hashed_answer = self.auth_controller.get_secret_answer_hash(self.user.username)
         except Exception as e:
-            self.show_error(str(e))
-            
-    def show_error(self, message: str):
-        self.error_message.setText(message)
-        self.error_message.show()
-        
-    def apply_theme(self):
-        self.setStyleSheet(self.theme.get_stylesheet(form_type=FormType.SECRET_QUESTION))
-
-    # Mouse event handlers for window dragging
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._dragging = True
-            self._drag_position = event.globalPos() - self.pos()
-            event.accept()
+            self._on_verify_error(e)
+            return
+        self.verify_button.setEnabled(False)
+        run_in_background(
+            lambda: self.auth_controller.check_secret_answer(answer, hashed_answer),
+            self._on_verify_result,
+            self._on_verify_error
+        )
 
-    def mouseMoveEvent(self, event):
-        if event.buttons() & Qt.LeftButton and self._dragging:
-            self.move(event.globalPos() - self._drag_position)
-            event.accept()
+    def _on_verify_result(self, is_valid: bool):
+        """Passer à la réinitialisation si la réponse est correcte"""
+        self.verify_button.setEnabled(True)
+        if is_valid:
+            from .reset_password import ResetPasswordForm
+            show_next_form(
+                self,
+                lambda: ResetPasswordForm(
+                    user=self.user, theme=self.theme, login_form=self.login_form
+                )
+            )
+        else:
+            self.show_error("Réponse incorrecte")
 
-    def mouseReleaseEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._dragging = False
-            event.accept()
+    def _on_verify_error(self, error: Exception):
+        self.verify_button.setEnabled(True)
+        self.show_error(str(error))
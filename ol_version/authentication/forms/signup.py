@@ -1,30 +1,41 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Type
 
-from ..controllers.user_controller import AuthController
-from ..models.user_model import UserType, UserModel
+from ..models.user_model import SECRET_QUESTION_CHOICES
 from ..controllers.registration_code_controller import RegistrationCodeController
 from ...core.commons import (
     QWidget,
-    QDialog,
     QHBoxLayout,
     Qt,
-    QCheckBox,
-    QFormLayout,
-    QVBoxLayout,
-    QPoint,
     Signal
 )
 from ...widgets.text import Text
 from ...widgets.text_field import TextField, EmailField, PasswordField
 from ...widgets.button import Button
 from ...widgets.combobox import ComboBox
-from ...components.image_widget import ImageWidget
 
-from ...widgets.themes.button_themes import ButtonTheme, ButtonThemes
-from ...widgets.themes.text_themes import TextTheme, TextThemes
-from ..themes.auth_forms_themes import FormTheme, FormThemes, FormType
+from ...widgets.themes.button_themes import ButtonThemes
+from ...widgets.themes.text_themes import TextThemes
+from ..themes.auth_forms_themes import FormTheme, FormType
+from ...core.utils import run_in_background
+from ._base import AuthFormBase, show_next_form
 
-class RegisterForm(QDialog):
+if TYPE_CHECKING:
+    from .login import LoginForm
+
+# LoginForm, resolved on first use (login imports this module)
+_login_form_cls: Optional[Type["LoginForm"]] = None
+
+
+def _get_login_form_cls() -> Type["LoginForm"]:
+    """Résout la classe LoginForm une seule fois"""
+    global _login_form_cls
+    if _login_form_cls is None:
+        from .login import LoginForm
+        _login_form_cls = LoginForm
+    return _login_form_cls
+
+
+class RegisterForm(AuthFormBase):
     """
     Register form widget for authentication.
     
@@ -38,42 +49,16 @@ class RegisterForm(QDialog):
     register_failed = Signal(str)      # Emits error message
     show_login_form = Signal()         # Signal to show login form
     
+    OBJECT_NAME = "register-form"
+    FORM_TYPE = FormType.REGISTER
+    IMAGE_ASSET = "ksb_pyside_kit/assets/signup.png"
+    FORM_WIDTH = 900
+    FORM_SPACING = 5
+
     def __init__(self, theme: Optional[FormTheme] = None, parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self._dragging = False
-        self._drag_position = QPoint()
-        self.setObjectName("register-form")
-        self.setFixedWidth(900)  
-        
-        # Initialize controller
-        self.auth_controller = AuthController()
-        self.theme = theme or FormThemes.LIGHT
-        
-        # Main layout horizontal
-        self.main_layout = QHBoxLayout(self)
-        self.main_layout.setContentsMargins(0, 0, 0, 0)
-        self.main_layout.setSpacing(0)
-        
-        # Image section
-        self.image_container = QWidget()
-        self.image_container.setFixedWidth(400)
-        self.image_container.setObjectName("image-container")
-        self.image_layout = QVBoxLayout(self.image_container)
-        self.login_image = ImageWidget(
-            "ksb_pyside_kit/assets/signup.png",
-            width=400,
-            height=600,
-            keep_aspect_ratio=True
-        )
-        self.image_layout.addWidget(self.login_image)
-        self.main_layout.addWidget(self.image_container)
-        
-        # Form container
-        self.form_container = QWidget()
-        self.form_layout = QVBoxLayout(self.form_container)
-        self.form_layout.setContentsMargins(30, 30, 30, 30)
-        self.form_layout.setSpacing(5)
+        super().__init__(theme=theme, parent=parent)
+        self.login_image = self.image
+        self.registration_code_controller = RegistrationCodeController()
         
         # Welcome text
         self.welcome_label = Text(value="Inscription!", theme=TextThemes.H3_PRIMARY)
@@ -118,12 +103,11 @@ class RegisterForm(QDialog):
         self.form_layout.addWidget(self.registration_code_field)
         
         # Secret question field
-        questions = UserModel.secret_question.info["choices"]
         self.secret_question_field = ComboBox(
             key="secret_question",
             label="Question secrète (*)",
             required=True,
-            options=questions,
+            options=SECRET_QUESTION_CHOICES,
             width=430,
             parent=self
         )
@@ -221,15 +205,11 @@ class RegisterForm(QDialog):
         self.login_layout.setAlignment(Qt.AlignCenter)
         self.form_layout.addLayout(self.login_layout)
         self.form_layout.addStretch(1)
-        self.main_layout.addWidget(self.form_container)
-        
-        self.setLayout(self.main_layout)
         
         # Connect signal to handler
         self.show_login_form.connect(self.show_login_form_handler)
         
-        # Apply theme
-        self.apply_theme()
+        self._finalize()
     
     def switch_to_login(self):
         """Gérer la transition vers le formulaire de connexion"""
@@ -238,11 +218,12 @@ class RegisterForm(QDialog):
 
     def show_login_form_handler(self):
         """Gestionnaire appelé lorsque le signal show_login_form est émis"""
-        from .login import LoginForm  # Import local pour éviter les imports circulaires
-        login_form = LoginForm()
-        login_form.show_register_form.connect(self.show_register_form_handler)
-        login_form.show()
-        self.close()
+        def build_login_form():
+            login_form = _get_login_form_cls()()
+            login_form.show_register_form.connect(self.show_register_form_handler)
+            return login_form
+
+        show_next_form(self, build_login_form)
 
     @classmethod
     def show_register_form_handler(cls, theme=None):
@@ -264,51 +245,79 @@ class RegisterForm(QDialog):
             self.secret_answer_field
         ]
         
-        if not all(field.is_valid() for field in required_fields):
+        # Validate every field (no short-circuit) so each one shows its own error
+        invalid_fields = [field for field in required_fields if not field.is_valid()]
+        if invalid_fields:
             return
         
         if self.password_field.value != self.confirme_password_field.value:
             self.show_error("Les mots de passe ne correspondent pas")
             return
             
-        try:
-            # Verify registration code
-            reg_controller = RegistrationCodeController()
-            code_valid, user_type = reg_controller.verify_code(self.registration_code_field.value)
-            
-            if not code_valid:
-                self.show_error("Code d'inscription invalide ou expiré")
-                return
-            
-            # Create user
-            user = self.auth_controller.create_user(
-                username=self.username_field.value,
-                email=self.email_field.value,
-                password=self.password_field.value,
-                user_type=user_type,
-                secret_question=self.secret_question_field.value,
-                secret_answer=self.secret_answer_field.value
-            )
-            
-            if user:
-                # Mark registration code as used
-                reg_controller.mark_code_as_used(self.registration_code_field.value)
-                self.clear_form()
-                self.register_success.emit(user)
-                # Transition vers le formulaire de connexion après inscription réussie
-                self.show_login_form_handler()
-            else:
-                self.show_error("L'inscription a échoué. Veuillez réessayer.")
-                self.register_failed.emit("Registration failed")
-                
-        except Exception as e:
-            self.show_error(str(e))
-            self.register_failed.emit(str(e))
-    
-    def show_error(self, message: str):
-        """Display error message"""
-        self.error_message.setText(message)
-        self.error_message.show()
+        # Only the bcrypt hashing runs in the pool; the code check and the account
+        # creation use the shared database session, so they stay on the GUI thread
+        username = self.username_field.value
+        email = self.email_field.value
+        password = self.password_field.value
+        code = self.registration_code_field.value
+        secret_question = self.secret_question_field.value
+        secret_answer = self.secret_answer_field.value
+        self.signup_button.setEnabled(False)
+        run_in_background(
+            lambda: self.auth_controller.hash_credentials(password, secret_answer),
+            lambda hashes: self._on_register_result(
+                self._register(username, email, code, secret_question, *hashes)
+            ),
+            self._on_register_error
+        )
+
+    def _register(self, username, email, code, secret_question, hashed_password, hashed_answer):
+        """
+        Verify the registration code and create the user from hashed credentials
+        Returns:
+            Tuple[Optional[UserModel], bool]: Created user (None on failure) and
+            whether the registration code was valid
+        """
+        reg_controller = self.registration_code_controller
+        code_valid, user_type = reg_controller.verify_code(code)
+        # Claim the code before creating the account: of two sign-ups racing
+        # on the same code, only one gets past this point
+        if not code_valid or not reg_controller.mark_code_as_used(code):
+            return None, False
+
+        user = self.auth_controller.create_hashed_user(
+            username=username,
+            email=email,
+            hashed_password=hashed_password,
+            user_type=user_type,
+            secret_question=secret_question,
+            hashed_answer=hashed_answer
+        )
+        if not user:
+            # Give the code back for the next attempt
+            reg_controller.release_code(code)
+        return user, True
+
+    def _on_register_result(self, result):
+        """Handle the outcome of a registration attempt"""
+        self.signup_button.setEnabled(True)
+        user, code_valid = result
+        if not code_valid:
+            self.show_error("Code d'inscription invalide ou expiré")
+        elif user:
+            self.clear_form()
+            self.register_success.emit(user)
+            # Transition vers le formulaire de connexion après inscription réussie
+            self.show_login_form_handler()
+        else:
+            self.show_error("L'inscription a échoué. Veuillez réessayer.")
+            self.register_failed.emit("Registration failed")
+
+    def _on_register_error(self, error: Exception):
+        """Handle an error raised during registration"""
+        self.signup_button.setEnabled(True)
+        self.show_error(str(error))
+        self.register_failed.emit(str(error))
     
     def clear_form(self):
         """Reset form to initial state"""
@@ -319,26 +328,3 @@ class RegisterForm(QDialog):
         self.registration_code_field.clear_content()
         self.secret_answer_field.clear_content()
         self.error_message.hide()
-    
-    def apply_theme(self):
-        """Apply current theme to form"""
-        self.setStyleSheet(self.theme.get_stylesheet(form_type=FormType.REGISTER))
-
-    def mousePressEvent(self, event):
-        """Gérer le clic de souris pour commencer le déplacement"""
-        if event.button() == Qt.LeftButton:
-            self._dragging = True
-            self._drag_position = event.globalPos() - self.pos()
-            event.accept()
-
-    def mouseMoveEvent(self, event):
-        """Gérer le déplacement de la fenêtre"""
-        if event.buttons() & Qt.LeftButton and self._dragging:
-            self.move(event.globalPos() - self._drag_position)
-            event.accept()
-
-    def mouseReleaseEvent(self, event):
-        """Gérer le relâchement du clic pour arrêter le déplacement"""
-        if event.button() == Qt.LeftButton:
-            self._dragging = False
-            event.accept()
\ No newline at end of file
@@ -1,7 +1,7 @@
 from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Boolean, Enum
 from ...models import BaseModel
-from .user_model import UserType
+from .user_model import UserType, USER_TYPE_CHOICES
 from ...components.widget_types import WidgetType
 
 class RegistrationCodeModel(BaseModel):
@@ -27,7 +27,7 @@ class RegistrationCodeModel(BaseModel):
         info={
             "verbose_name": "Type d'utilisateur",
             "widget_type": WidgetType.COMBOBOX,
-            "choices": [(t.value, t.value) for t in UserType],
+            "choices": USER_TYPE_CHOICES,
             "filterable": True,
         }
     )
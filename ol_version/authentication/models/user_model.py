@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Tuple
 from sqlalchemy import Column, String, Boolean, DateTime, Enum
 import enum
 from ...components.widget_types import WidgetType
@@ -10,6 +11,23 @@ class UserType(enum.Enum):
     SUPERUSER = "superuser"
     DEFAULT = "user"
 
+# User types offered in forms, as (label, value) pairs
+USER_TYPE_CHOICES: Tuple[Tuple[str, str], ...] = tuple((t.value, t.value) for t in UserType)
+
+# Secret questions offered at registration, as (label, value) pairs
+SECRET_QUESTION_CHOICES: Tuple[Tuple[str, str], ...] = tuple(
+    (question, question) for question in (
+        "Quel est le nom de votre premier animal de compagnie ?",
+        "Dans quelle ville êtes-vous né(e) ?",
+        "Quel est le nom de jeune fille de votre mère ?",
+        "Quel est votre film préféré ?",
+        "Quel est le nom de votre meilleur ami ?",
+        "Quel est le nom de votre école primaire ?",
+        "Quel est votre plat préféré ?",
+        "Quel est le nom de votre héros d'enfance ?",
+    )
+)
+
 class UserModel(BaseModel):
     """User model for authentication and authorization"""
     __tablename__ = "users"
@@ -71,7 +89,7 @@ class UserModel(BaseModel):
         info={
             "verbose_name": "Type d'utilisateur",
             "widget_type": WidgetType.COMBOBOX,
-            "choices": [(t.value, t.value) for t in UserType],
+            "choices": USER_TYPE_CHOICES,
             "tab_col_index": 6,
             "filterable": True,
         }
@@ -91,16 +109,7 @@ class UserModel(BaseModel):
         info={
             "verbose_name": "Question secrète",
             "widget_type": WidgetType.COMBOBOX,
-            "choices": [
-                ("Quel est le nom de votre premier animal de compagnie ?", "Quel est le nom de votre premier animal de compagnie ?"),
-                ("Dans quelle ville êtes-vous né(e) ?", "Dans quelle ville êtes-vous né(e) ?"),
-                ("Quel est le nom de jeune fille de votre mère ?", "Quel est le nom de jeune fille de votre mère ?"),
-                ("Quel est votre film préféré ?", "Quel est votre film préféré ?"),
-                ("Quel est le nom de votre meilleur ami ?", "Quel est le nom de votre meilleur ami ?"),
-                ("Quel est le nom de votre école primaire ?", "Quel est le nom de votre école primaire ?"),
-                ("Quel est votre plat préféré ?", "Quel est votre plat préféré ?"),
-                ("Quel est le nom de votre héros d'enfance ?", "Quel est le nom de votre héros d'enfance ?"),
-            ],
+            "choices": SECRET_QUESTION_CHOICES,
             "tab_col_index": 8,
         }
     )
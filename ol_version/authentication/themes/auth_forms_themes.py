@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import Dict, Optional, Tuple
 
 class FormType(Enum):
     """Types de formulaires d'authentification"""
@@ -9,9 +10,28 @@ class FormType(Enum):
     SECRET_QUESTION = auto()
     RESET_PASSWORD = auto()
 
-@dataclass
+_FORM_IDS = {
+    FormType.LOGIN: "auth-form",
+    FormType.REGISTER: "register-form",
+    FormType.FORGOT_PASSWORD: "forgot-password-form",
+    FormType.SECRET_QUESTION: "secret-question-form",
+    FormType.RESET_PASSWORD: "reset-password-form"
+}
+
+# Rendered stylesheets keyed by (form type, theme values), so recreating a
+# form hands Qt the very same string instead of formatting a new one
+_STYLESHEET_CACHE: Dict[Tuple[FormType, "FormTheme"], str] = {}
+
+# Theme installed application-wide by install_auth_theme, and its QSS
+_app_theme: Optional["FormTheme"] = None
+_app_stylesheet: str = ""
+
+@dataclass(frozen=True, slots=True)
 class FormTheme:
-    """Theme configuration for all authentication forms"""
+    """
+    Theme configuration for all authentication forms
+    Immutable and hashable: derive variants with dataclasses.replace()
+    """
     # Main colors
     background_color: str = "#ffffff"
     image_background_color: str = "#f0f4f8" 
@@ -20,19 +40,21 @@ class FormTheme:
     input_bg_color: str = "#FFFFFF"
     error_color: str = "#FA896B"
 
-    def get_stylesheet(self, form_type: FormType) -> str:
+    def get_stylesheet(self, form_type: FormType = FormType.LOGIN) -> str:
         """
         Generate stylesheet for forms based on form type
         Args:
-            form_type: Type of authentication form
+            form_type: Type of authentication form (login form by default)
         """
-        form_id = {
-            FormType.LOGIN: "auth-form",
-            FormType.REGISTER: "register-form",
-            FormType.FORGOT_PASSWORD: "forgot-password-form",
-            FormType.SECRET_QUESTION: "secret-question-form",
-            FormType.RESET_PASSWORD: "reset-password-form"
-        }[form_type]
+        key = (form_type, self)
+        stylesheet = _STYLESHEET_CACHE.get(key)
+        if stylesheet is None:
+            stylesheet = _STYLESHEET_CACHE[key] = self._build_stylesheet(form_type)
+        return stylesheet
+
+    def _build_stylesheet(self, form_type: FormType) -> str:
+        """Render the stylesheet without consulting the cache"""
+        form_id = _FORM_IDS[form_type]
 
         return f"""
             QWidget#{form_id} {{
@@ -42,13 +64,13 @@ class FormTheme:
                 padding: 30px;
             }}
             
-            QWidget#image-container {{
+            QWidget#{form_id} QWidget#image-container {{
                 background-color: {self.image_background_color};
                 border-top-left-radius: 10px;
                 border-bottom-left-radius: 10px;
             }}
             
-            QLabel {{
+            QWidget#{form_id} QLabel {{
                 color: {self.text_color};
             }}
         """
@@ -72,4 +94,33 @@ class FormThemes:
         border_color="#3A445E",
         input_bg_color="#2A3447",
         error_color="#FA896B"
-    )
\ No newline at end of file
+    )
+
+
+def install_auth_theme(app, theme: Optional[FormTheme] = None) -> None:
+    """
+    Install the stylesheet of every authentication form on the application
+    Args:
+        app: The QApplication instance
+        theme: Theme to install, FormThemes.LIGHT by default
+
+    Qt then parses the form rules once for the whole application, and forms
+    using this theme skip their own setStyleSheet call. The rules are scoped
+    by form object name and appended to the existing application stylesheet.
+    """
+    global _app_theme, _app_stylesheet
+    theme = theme or FormThemes.LIGHT
+    stylesheet = "\n".join(theme.get_stylesheet(form_type) for form_type in FormType)
+
+    base = app.styleSheet()
+    if _app_stylesheet and base.endswith(_app_stylesheet):
+        base = base[:-len(_app_stylesheet)]
+    app.setStyleSheet(base + stylesheet)
+
+    _app_theme = theme
+    _app_stylesheet = stylesheet
+
+
+def is_app_theme(theme: FormTheme) -> bool:
+    """Whether the theme is already installed application-wide"""
+    return theme is _app_theme
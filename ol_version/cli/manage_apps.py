@@ -1,5 +1,7 @@
 import click
 import os
+import shutil
+import sys
 from pathlib import Path
 
 TEMPLATE_FILES = {
@@ -30,6 +32,20 @@ from ksb_pyside_kit.components import Page
     '__init__.py': ''
 }
 
+def _render_template(template, substitutions):
+    """Replace the {placeholder} tokens of a template, leaving any other brace untouched"""
+    for name, value in substitutions.items():
+        template = template.replace('{' + name + '}', value)
+    return template
+
+def _chmod_retry(func, path, _exc):
+    """Make a read-only entry writable, then retry the failed removal"""
+    os.chmod(path, 0o700)
+    func(path)
+
+# rmtree renamed its error callback to onexc in Python 3.12 (onerror is deprecated)
+_RMTREE_ERROR_HANDLER = 'onexc' if sys.version_info >= (3, 12) else 'onerror'
+
 @click.group()
 def cli():
     """CLI pour la gestion des applications"""
@@ -60,14 +76,19 @@ def create_app(app_name):
         click.echo(click.style(f'Création du dossier: {app_dir}', fg='green'))
 
         # Create app files
+        substitutions = {
+            'app_name': app_name,
+            'app_name_title': app_name_title,
+            'app_path': app_path,
+        }
         for filename, template in TEMPLATE_FILES.items():
             file_path = app_dir / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(template.format(
-                    app_name=app_name,
-                    app_name_title=app_name_title,
-                    app_path=app_path
-                ))
+            if template:
+                file_path.write_text(
+                    _render_template(template, substitutions), encoding='utf-8', newline='\n'
+                )
+            else:
+                file_path.touch()
             click.echo(click.style(f'Création du fichier: {file_path}', fg='green'))
 
         click.echo(click.style(f'\nApplication {app_name} créée avec succès !', fg='green'))
@@ -96,8 +117,7 @@ def delete_app(app_name):
             return
 
         if click.confirm(f'Êtes-vous sûr de vouloir supprimer l\'application {app_name} ?', abort=True):
-            import shutil
-            shutil.rmtree(app_dir)
+            shutil.rmtree(app_dir, **{_RMTREE_ERROR_HANDLER: _chmod_retry})
             click.echo(click.style(f'Application {app_name} supprimée avec succès !', fg='green'))
 
     except Exception as e:
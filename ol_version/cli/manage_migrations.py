@@ -1,110 +1,227 @@
 import click
+import hashlib
+import json
 import os
+import shutil
+import time
+from collections import deque
 from pathlib import Path
-import subprocess
-from typing import Optional
+from typing import Dict, List, Optional
+
+# Number of trailing stderr lines kept for the error report
+STDERR_TAIL_LINES = 200
+# Alembic writes UTF-8; output is only decoded when it is returned or reported
+OUTPUT_ENCODING = "utf-8"
+# Seconds during which a cached 'alembic history' output is reused
+HISTORY_CACHE_TTL = 300
+# Application directory (click.get_app_dir) holding the history cache files
+HISTORY_CACHE_APP = "ksb-pyside-kit"
 
 class MigrationManager:
     def __init__(self, migrations_dir: str = "migrations"):
         self.migrations_dir = migrations_dir
-        
-    def init(self) -> bool:
-        """Initialise alembic migrations"""
-        try:
-            result = subprocess.run(
-                ["alembic", "init", self.migrations_dir], 
-                capture_output=True,
-                text=True,
-                check=True
+        # Resolved once rather than searched on PATH by every command
+        self._alembic = shutil.which("alembic") or "alembic"
+
+    def _run(
+        self, args: List[str], error_message: Optional[str], echo: bool = True
+    ) -> Optional[str]:
+        """
+        Run an alembic command
+        Args:
+            args: Alembic arguments
+            error_message: Heading displayed if the command fails, None to fail silently
+            echo: Stream the standard output to the terminal as it arrives
+                instead of collecting it
+        Returns:
+            The collected standard output ("" when echoed), None on failure
+
+        Echoed lines are written to the terminal as raw bytes, without decoding.
+        """
+        # Only needed once a command actually runs, not for --help
+        import subprocess
+        import threading
+
+        with subprocess.Popen(
+            [self._alembic, *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        ) as process:
+            # Drain stderr alongside stdout so neither pipe fills up and blocks alembic
+            stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+            stderr_reader = threading.Thread(
+                target=stderr_tail.extend, args=(process.stderr,), daemon=True
             )
-            return True
-        except subprocess.CalledProcessError as e:
-            click.echo(click.style("Erreur lors de l'initialisation:", fg="red"))
-            click.echo(click.style(f"Code de sortie: {e.returncode}", fg="yellow"))
-            if e.stdout:
-                click.echo(click.style("Sortie standard:", fg="yellow"))
-                click.echo(e.stdout)
-            if e.stderr:
-                click.echo(click.style("Erreur standard:", fg="red"))
-                click.echo(e.stderr)
+            stderr_reader.start()
+
+            output = []
+            for line in process.stdout:
+                if echo:
+                    click.echo(line, nl=False)
+                else:
+                    output.append(line)
+            returncode = process.wait()
+            stderr_reader.join()
+
+        if returncode != 0:
+            if error_message is None:
+                return None
+            # Written in a single call so reports from parallel upgrades don't interleave
+            report = [
+                click.style(error_message, fg="red"),
+                click.style(f"Code de sortie: {returncode}", fg="yellow"),
+            ]
+            if output:
+                report.append(click.style("Sortie standard:", fg="yellow"))
+                report.append(self._decode(output).rstrip("\n"))
+            if stderr_tail:
+                report.append(click.style("Erreur standard:", fg="red"))
+                report.append(self._decode(stderr_tail).rstrip("\n"))
+            click.echo("\n".join(report))
+            return None
+        return self._decode(output)
+
+    @staticmethod
+    def _decode(lines) -> str:
+        """Decode raw output lines"""
+        return b"".join(lines).decode(OUTPUT_ENCODING, errors="replace")
+
+    @staticmethod
+    def _revisions(output: Optional[str]) -> set:
+        """Revision ids listed by 'alembic current' or 'alembic heads'"""
+        return {line.split()[0] for line in (output or "").splitlines() if line.strip()}
+
+    def _is_at_head(self, config: str) -> bool:
+        """Whether the database of an alembic configuration is already at head"""
+        # Failures are left to the upgrade itself, which reports them
+        current = self._run(["-c", config, "current"], None, echo=False)
+        heads = self._run(["-c", config, "heads"], None, echo=False)
+        if current is None or heads is None:
             return False
+        return self._revisions(current) == self._revisions(heads)
+
+    def init(self) -> bool:
+        """Initialise alembic migrations"""
+        return self._run(
+            ["init", self.migrations_dir], "Erreur lors de l'initialisation:"
+        ) is not None
             
     def create(self, message: str) -> Optional[str]:
         """Create a new migration"""
-        try:
-            result = subprocess.run(
-                ["alembic", "revision", "--autogenerate", "-m", message],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout
-        except subprocess.CalledProcessError as e:
-            click.echo(click.style("Erreur lors de la création de la migration:", fg="red"))
-            click.echo(click.style(f"Code de sortie: {e.returncode}", fg="yellow"))
-            if e.stdout:
-                click.echo(click.style("Sortie standard:", fg="yellow"))
-                click.echo(e.stdout)
-            if e.stderr:
-                click.echo(click.style("Erreur standard:", fg="red"))
-                click.echo(e.stderr)
-            return None
+        return self._run(
+            ["revision", "--autogenerate", "-m", message],
+            "Erreur lors de la création de la migration:",
+            echo=False
+        )
             
     def upgrade(self, revision: str = "head") -> bool:
         """upgrade the database"""
-        try:
-            result = subprocess.run(
-                ["alembic", "upgrade", revision],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return True
-        except subprocess.CalledProcessError as e:
-            click.echo(click.style("Erreur lors de la mise à jour:", fg="red"))
-            click.echo(click.style(f"Code de sortie: {e.returncode}", fg="yellow"))
-            if e.stdout:
-                click.echo(click.style("Sortie standard:", fg="yellow"))
-                click.echo(e.stdout)
-            if e.stderr:
-                click.echo(click.style("Erreur standard:", fg="red"))
-                click.echo(e.stderr)
-            return False
+        return self._run(
+            ["upgrade", revision], "Erreur lors de la mise à jour:"
+        ) is not None
+
+    def upgrade_many(self, configs: List[str], workers: int = 6) -> Dict[str, bool]:
+        """
+        Upgrade several databases to head in parallel
+        Args:
+            configs: Alembic configuration files, one per database (tenant)
+            workers: Number of alembic processes run at the same time
+        Returns:
+            Success of each configuration; databases already at head are skipped
+            and count as upgraded
+        """
+        # Each upgrade runs in its own alembic process, threads only wait on them
+        from concurrent.futures import ThreadPoolExecutor
+
+        def upgrade_one(config: str) -> bool:
+            if self._is_at_head(config):
+                return True
+            return self._run(
+                ["-c", config, "upgrade", "head"],
+                f"Erreur lors de la mise à jour ({config}):",
+                echo=False
+            ) is not None
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            return dict(zip(configs, executor.map(upgrade_one, configs)))
 
     def downgrade(self, revision: str = "-1") -> bool:
         """Downgrade the database"""
-        try:
-            result = subprocess.run(
-                ["alembic", "downgrade", revision],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return True
-        except subprocess.CalledProcessError as e:
-            click.echo(click.style("Erreur lors du retour arrière:", fg="red"))
-            click.echo(click.style(f"Code de sortie: {e.returncode}", fg="yellow"))
-            if e.stdout:
-                click.echo(click.style("Sortie standard:", fg="yellow"))
-                click.echo(e.stdout)
-            if e.stderr:
-                click.echo(click.style("Erreur standard:", fg="red"))
-                click.echo(e.stderr)
-            return False
+        return self._run(
+            ["downgrade", revision], "Erreur lors du retour arrière:"
+        ) is not None
             
-    def history(self) -> Optional[str]:
-        """Show the migration history"""
+    def history(self, echo: bool = False, use_cache: bool = True) -> Optional[str]:
+        """
+        Show the migration history
+        Args:
+            echo: Print the history to the terminal instead of returning it
+            use_cache: Reuse the last output while the revision files are unchanged
+
+        'alembic history' only reads the revision scripts, so its output is cached
+        for HISTORY_CACHE_TTL seconds, keyed on the name, size and modification
+        time of every file in the versions directory.
+        """
+        fingerprint = self._versions_fingerprint() if use_cache else None
+        output = self._read_history_cache(fingerprint) if fingerprint else None
+        if output is None:
+            output = self._run(
+                ["history"], "Erreur lors de l'affichage de l'historique:", echo=False
+            )
+            if output is not None and fingerprint:
+                self._write_history_cache(fingerprint, output)
+
+        if echo and output is not None:
+            click.echo(output, nl=False)
+            return ""
+        return output
+
+    def _history_cache_path(self) -> Path:
+        """Cache file of this migrations directory, in the user's application directory
+
+        The shared temp directory is avoided: another local user could plant
+        a cache file there and have its content printed as the history.
+        """
+        directory = os.path.abspath(self.migrations_dir).encode()
+        digest = hashlib.sha1(directory).hexdigest()[:16]
+        return Path(click.get_app_dir(HISTORY_CACHE_APP)) / f"alembic_history_{digest}.json"
+
+    def _versions_fingerprint(self) -> Optional[str]:
+        """Digest of the revision files, None when there is no versions directory"""
+        versions = Path(self.migrations_dir) / "versions"
         try:
-            result = subprocess.run(
-                ["alembic", "history"],
-                capture_output=True,
-                text=True,
-                check=True
+            entries = sorted(
+                (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+                for entry in os.scandir(versions) if entry.is_file()
             )
-            return result.stdout
-        except subprocess.CalledProcessError as e:
-            click.echo(click.style(f"Erreur lors de l'affichage de l'historique: {str(e)}", fg="red"))
+        except OSError:
             return None
+        return hashlib.sha1(repr(entries).encode()).hexdigest()
+
+    def _read_history_cache(self, fingerprint: str) -> Optional[str]:
+        """Cached history output, None if missing, stale or for other revision files"""
+        try:
+            with open(self._history_cache_path(), encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict):
+            return None
+        if cached.get("fingerprint") != fingerprint:
+            return None
+        if time.time() - cached.get("created", 0) > HISTORY_CACHE_TTL:
+            return None
+        return cached.get("output")
+
+    def _write_history_cache(self, fingerprint: str, output: str) -> None:
+        """Store the history output; the cache is best effort"""
+        path = self._history_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "created": time.time(), "output": output}, f)
+        except OSError:
+            pass
 
 @click.group()
 def cli():
@@ -136,6 +253,21 @@ def upgrade(revision):
     if manager.upgrade(revision):
         click.echo(click.style("Base de données mise à jour avec succès!", fg="green"))
 
+@cli.command()
+@click.argument('configs', nargs=-1, required=True)
+@click.option(
+    '--workers', default=6, show_default=True, help='Nombre de mises à jour simultanées'
+)
+def upgrade_many(configs, workers):
+    """Upgrade several databases (one alembic.ini each) to head"""
+    manager = MigrationManager()
+    results = manager.upgrade_many(list(configs), workers=workers)
+    failed = [config for config, ok in results.items() if not ok]
+    if failed:
+        click.echo(click.style(f"Échec de la mise à jour pour: {', '.join(failed)}", fg="red"))
+    else:
+        click.echo(click.style(f"{len(results)} base(s) de données à jour!", fg="green"))
+
 @cli.command()
 @click.option('--revision', default='-1', help='Révision cible (défaut: -1)')
 def downgrade(revision):
@@ -145,12 +277,13 @@ def downgrade(revision):
         click.echo(click.style("Retour arrière effectué avec succès!", fg="green"))
 
 @cli.command()
-def history():
+@click.option(
+    '--no-cache', is_flag=True, help="Relancer alembic même si l'historique est en cache"
+)
+def history(no_cache):
     """show the migration history"""
     manager = MigrationManager()
-    hist = manager.history()
-    if hist:
-        click.echo(hist)
+    manager.history(echo=True, use_cache=not no_cache)
 
 if __name__ == '__main__':
     cli()
\ No newline at end of file
@@ -1,71 +1,97 @@
 import click
-from ..authentication.controllers.user_controller import AuthController, PasswordValidationError
-from ..authentication.models.user_model import UserType
 from getpass import getpass
 
+# The authentication controller and models pull in SQLAlchemy and the
+# application database; they are imported inside the commands so that
+# --help and shell completion stay fast.
+
+SECURITY_QUESTIONS = (
+    "What was your first pet name?",
+    "What city were you born in?",
+    "What is your mother's maiden name?",
+    "What is your favorite movie?",
+)
+
+# Numbered list shown before asking for the question, rendered once
+_QUESTIONS_PROMPT = "\n".join(
+    f"{idx}. {question}" for idx, question in enumerate(SECURITY_QUESTIONS, 1)
+)
+
 @click.group()
 def cli():
     """CLI tools for user management"""
     pass
 
-@cli.command()
-@click.option('--username', prompt='Username', help='Username for the new user')
-@click.option('--email', prompt='Email', help='Email address')
-@click.option('--first-name', prompt='First name', help='First name')
-@click.option('--last-name', prompt='Last name', help='Last name')
-def create_user(username, email, first_name, last_name):
-    """Create a new regular user"""
-    try:
-        # Get password securely
-        while True:
-            password = getpass('Password: ')
-            password_confirm = getpass('Confirm password: ')
-            
-            if password == password_confirm:
-                break
-            click.echo('Passwords do not match. Please try again.')
+def _prompt_credentials():
+    """Ask for the password and the security question, return them as a dict"""
+    # Get password securely
+    while True:
+        password = getpass('Password: ')
+        password_confirm = getpass('Confirm password: ')
+        
+        if password == password_confirm:
+            break
+        click.echo('Passwords do not match. Please try again.')
 
-        # Get secret question and answer
-        click.echo('\nAvailable security questions:')
-        questions = [
-            "What was your first pet name?",
-            "What city were you born in?",
-            "What is your mother's maiden name?",
-            "What is your favorite movie?"
-        ]
-        for idx, question in enumerate(questions, 1):
-            click.echo(f"{idx}. {question}")
+    # Get secret question and answer
+    click.echo('\nAvailable security questions:\n' + _QUESTIONS_PROMPT)
+    
+    # IntRange makes click re-prompt on an out-of-range number
+    question_idx = click.prompt(
+        f'Select a security question (1-{len(SECURITY_QUESTIONS)})',
+        type=click.IntRange(1, len(SECURITY_QUESTIONS))
+    )
         
-        question_idx = click.prompt('Select a security question (1-4)', type=int)
-        if not 1 <= question_idx <= len(questions):
-            raise click.BadParameter('Invalid question number')
-            
-        secret_question = questions[question_idx - 1]
-        secret_answer = click.prompt('Your answer', hide_input=True)
+    return {
+        'password': password,
+        'secret_question': SECURITY_QUESTIONS[question_idx - 1],
+        'secret_answer': click.prompt('Your answer', hide_input=True),
+    }
+
+def _create_account(label, user_type_name, username, email, first_name, last_name):
+    """
+    Prompt for the credentials and create the account
+    Args:
+        label: Account kind shown in messages ('User', 'Superuser')
+        user_type_name: Name of the UserType member to assign
+    """
+    from ..authentication.controllers.user_controller import AuthController, PasswordValidationError
+    from ..authentication.models.user_model import UserType
+
+    try:
+        credentials = _prompt_credentials()
 
-        # Create user
-        auth_controller = AuthController()
-        user = auth_controller.create_user(
+        user = AuthController.instance().create_user(
             username=username,
             email=email,
-            password=password,
             first_name=first_name,
             last_name=last_name,
-            secret_question=secret_question,
-            secret_answer=secret_answer,
-            user_type=UserType.DEFAULT
+            user_type=UserType[user_type_name],
+            **credentials
         )
         
         if user:
-            click.echo(click.style('User created successfully!', fg='green'))
+            click.echo(click.style(f'{label} created successfully!', fg='green'))
         else:
-            click.echo(click.style('Failed to create user. Username or email might already exist.', fg='red'))
+            click.echo(click.style(
+                f'Failed to create {label.lower()}. Username or email might already exist.',
+                fg='red'
+            ))
             
     except PasswordValidationError as e:
         click.echo(click.style(f'Password validation failed: {str(e)}', fg='red'))
     except Exception as e:
         click.echo(click.style(f'An error occurred: {str(e)}', fg='red'))
 
+@cli.command()
+@click.option('--username', prompt='Username', help='Username for the new user')
+@click.option('--email', prompt='Email', help='Email address')
+@click.option('--first-name', prompt='First name', help='First name')
+@click.option('--last-name', prompt='Last name', help='Last name')
+def create_user(username, email, first_name, last_name):
+    """Create a new regular user"""
+    _create_account('User', 'DEFAULT', username, email, first_name, last_name)
+
 @cli.command()
 @click.option('--username', prompt='Username', help='Username for the new superuser')
 @click.option('--email', prompt='Email', help='Email address')
@@ -73,56 +99,7 @@ def create_user(username, email, first_name, last_name):
 @click.option('--last-name', prompt='Last name', help='Last name')
 def create_superuser(username, email, first_name, last_name):
     """Create a new superuser (admin)"""
-    try:
-        # Get password securely
-        while True:
-            password = getpass('Password: ')
-            password_confirm = getpass('Confirm password: ')
-            
-            if password == password_confirm:
-                break
-            click.echo('Passwords do not match. Please try again.')
-
-        # Get secret question and answer
-        click.echo('\nAvailable security questions:')
-        questions = [
-            "What was your first pet name?",
-            "What city were you born in?",
-            "What is your mother's maiden name?",
-            "What is your favorite movie?"
-        ]
-        for idx, question in enumerate(questions, 1):
-            click.echo(f"{idx}. {question}")
-        
-        question_idx = click.prompt('Select a security question (1-4)', type=int)
-        if not 1 <= question_idx <= len(questions):
-            raise click.BadParameter('Invalid question number')
-            
-        secret_question = questions[question_idx - 1]
-        secret_answer = click.prompt('Your answer', hide_input=True)
-
-        # Create superuser
-        auth_controller = AuthController()
-        user = auth_controller.create_user(
-            username=username,
-            email=email,
-            password=password,
-            first_name=first_name,
-            last_name=last_name,
-            secret_question=secret_question,
-            secret_answer=secret_answer,
-            user_type=UserType.ADMIN
-        )
-        
-        if user:
-            click.echo(click.style('Superuser created successfully!', fg='green'))
-        else:
-            click.echo(click.style('Failed to create superuser. Username or email might already exist.', fg='red'))
-            
-    except PasswordValidationError as e:
-        click.echo(click.style(f'Password validation failed: {str(e)}', fg='red'))
-    except Exception as e:
-        click.echo(click.style(f'An error occurred: {str(e)}', fg='red'))
+    _create_account('Superuser', 'ADMIN', username, email, first_name, last_name)
 
 if __name__ == '__main__':
-    cli()
\ No newline at end of file
+    cli()
@@ -0,0 +1,18 @@
+from typing import Type, TypeVar
+
+BoxLayout = TypeVar("BoxLayout")
+
+
+def themed_layout(layout_class: Type[BoxLayout], parent, theme) -> BoxLayout:
+    """
+    Create the main layout of a card with the theme's padding and spacing
+    Args:
+        layout_class: QVBoxLayout or QHBoxLayout
+        parent: Card the layout is installed on
+        theme: Card theme providing padding and spacing
+    """
+    layout = layout_class(parent)
+    padding = theme.padding
+    layout.setContentsMargins(padding, padding, padding, padding)
+    layout.setSpacing(theme.spacing)
+    return layout
@@ -9,6 +9,7 @@ from PySide6.QtCore import QPropertyAnimation, QEasingCurve, Property
 
 from ...core.commons import QFrame, QVBoxLayout, QHBoxLayout, QWidget, Qt, QTimer
 from ...widgets.text import Text
+from ._layouts import themed_layout
 from ..themes.cards import CardTheme, CardThemes
 from ...core.themes.themes import ThemeManager
 
@@ -36,6 +37,9 @@ class BaseCard(QFrame):
         
         # Animation properties
         self._elevation = 0
+        self._elevation_animation = QPropertyAnimation(self, b"elevation", self)
+        self._elevation_animation.setDuration(200)
+        self._elevation_animation.setEasingCurve(QEasingCurve.OutCubic)
         
         # Setup UI
         self.setup_ui()
@@ -44,24 +48,12 @@ class BaseCard(QFrame):
     def setup_ui(self):
         """Initialize the card UI components"""
         # Main layout
-        self.layout = QHBoxLayout(self)  # Changed to QHBoxLayout
-        self.layout.setContentsMargins(
-            self.theme.padding,
-            self.theme.padding,
-            self.theme.padding,
-            self.theme.padding
-        )
-        self.layout.setSpacing(self.theme.spacing)
+        self.layout = themed_layout(QHBoxLayout, self, self.theme)
         
         # Icon container (left side)
         icon_container = QFrame()
         icon_container.setObjectName("iconContainer")
         icon_container.setFixedSize(self.theme.icon_size + 20, self.theme.icon_size + 20)
-        icon_container.setStyleSheet(f"""
-            #iconContainer {{
-                border-radius: {(self.theme.icon_size + 20) // 2}px;
-            }}
-        """)
         
         icon_layout = QVBoxLayout(icon_container)
         icon_layout.setContentsMargins(0, 0, 0, 0)
@@ -107,12 +99,11 @@ class BaseCard(QFrame):
         super().leaveEvent(event)
     
     def _animate_elevation(self, end_value: int):
-        """Animate card elevation"""
-        animation = QPropertyAnimation(self, b"elevation", self)
-        animation.setDuration(200)
+        """Animate card elevation (retargets the card's single animation)"""
+        animation = self._elevation_animation
+        animation.stop()
         animation.setStartValue(self._elevation)
         animation.setEndValue(end_value)
-        animation.setEasingCurve(QEasingCurve.OutCubic)
         animation.start()
     
     def _get_elevation(self) -> int:
@@ -165,12 +156,6 @@ class StatCard(BaseCard):
         self.separator = QFrame()
         self.separator.setObjectName("separator")
         self.separator.setFixedHeight(self.theme.separator_height)
-        self.separator.setStyleSheet(f"""
-            #separator {{
-                background-color: {self.theme.separator_color};
-                margin: 5px 0px;
-            }}
-        """)
         self.content_layout.addWidget(self.separator)
         
         # Footer
@@ -215,4 +200,30 @@ class StatCard(BaseCard):
         """
         self.value = new_value
         self.value_label.text = new_value
-        
\ No newline at end of file
+        
+    def update_all(
+        self,
+        title: Optional[str] = None,
+        value: Optional[str] = None,
+        footer: Optional[str] = None
+    ):
+        """Update several texts of the card at once
+        
+        Args:
+            title: New title text, None to keep the current one
+            value: New value to display, None to keep the current one
+            footer: New footer text, None to keep the current one
+            
+        Unchanged texts are skipped and the card is repainted once for the
+        whole batch instead of once per label.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            if title is not None and title != self.title:
+                self.update_title(title)
+            if value is not None and value != self.value:
+                self.update_value(value)
+            if footer is not None and footer != self.description_text:
+                self.update_footer(footer)
+        finally:
+            self.setUpdatesEnabled(True)
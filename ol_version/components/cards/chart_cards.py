@@ -4,6 +4,7 @@ This module provides card widgets for displaying pie and bar charts
 using the native QtCharts library.
 """
 
+import json
 from typing import Optional, Dict, Any
 from ...core.commons import (
     Qt,
@@ -22,12 +23,16 @@ from ...core.commons import (
     QWidget
 )
 from ...widgets.text import Text
+from ._layouts import themed_layout
 from ..themes.chart_card import ChartTheme, ChartThemes
 from ...core.themes.themes import ThemeManager
 
 class ChartBaseCard(QFrame):
     """Base class for chart cards"""
     
+    # Parsed colors shared by every chart card, keyed by their name ("#1DC7EA")
+    _color_cache: Dict[str, QColor] = {}
+    
     def __init__(
         self,
         title: str,
@@ -46,6 +51,7 @@ class ChartBaseCard(QFrame):
         self.theme = theme or ChartThemes.LIGHT
         
         self._cached_data = None  
+        self._cached_key: Optional[str] = None
         
         # Setup UI
         self.setup_ui()
@@ -55,14 +61,7 @@ class ChartBaseCard(QFrame):
     def setup_ui(self):
         """Initialize the card UI components"""
         # Main layout
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(
-            self.theme.padding,
-            self.theme.padding,
-            self.theme.padding,
-            self.theme.padding
-        )
-        self.layout.setSpacing(self.theme.spacing)
+        self.layout = themed_layout(QVBoxLayout, self, self.theme)
         
         # Title
         self.title_label = Text(
@@ -78,7 +77,8 @@ class ChartBaseCard(QFrame):
         self.chart.legend().setAlignment(Qt.AlignBottom)
         
         self.chart_view = QChartView(self.chart)
-        self.chart_view.setRenderHint(QPainter.Antialiasing)
+        if self.theme.antialias:
+            self.chart_view.setRenderHint(QPainter.Antialiasing)
         self.chart_view.setMinimumHeight(300)
         self.chart_view.setMinimumWidth(300)
         self.layout.addWidget(self.chart_view)
@@ -87,12 +87,6 @@ class ChartBaseCard(QFrame):
         self.separator = QFrame()
         self.separator.setObjectName("separator")
         self.separator.setFixedHeight(self.theme.separator_height)
-        self.separator.setStyleSheet(f"""
-            #separator {{
-                background-color: {self.theme.separator_color};
-                margin: 5px 0px;
-            }}
-        """)
         self.layout.addWidget(self.separator)
         
         # Footer
@@ -105,6 +99,30 @@ class ChartBaseCard(QFrame):
         self.layout.addWidget(self.footer_label)
         self.layout.addStretch(1)
         
+    def _data_changed(self, data: Dict[str, Any]) -> bool:
+        """Record data as displayed, return False if it matches what is shown
+        
+        The comparison uses a JSON snapshot, so a dict mutated in place by the
+        caller since the previous update is still seen as changed.
+        """
+        key = json.dumps(data, sort_keys=True, default=str)
+        if key == self._cached_key:
+            return False
+        self._cached_key = key
+        if self._cached_data is not None and not self.theme.animate_updates:
+            # Only the first data set is animated in
+            self.chart.setAnimationOptions(QChart.NoAnimation)
+        self._cached_data = data
+        return True
+        
+    @classmethod
+    def _color(cls, name: str) -> QColor:
+        """QColor for a color name, parsed once"""
+        color = cls._color_cache.get(name)
+        if color is None:
+            color = cls._color_cache[name] = QColor(name)
+        return color
+        
     def clear_chart(self):
         """Nettoie complètement le graphique"""
         self.chart.removeAllSeries()
@@ -128,24 +146,42 @@ class PieChartCard(ChartBaseCard):
         theme: Optional[ChartTheme] = None,
         parent=None
     ):
+        self._series: Optional[QPieSeries] = None
         super().__init__(title, description_text, theme, parent)
         self.update_chart(data)
         
     def update_chart(self, data: Dict[str, Any]):
-        """Update pie chart with new data"""
-        self._cached_data = data
+        """Update pie chart with new data
+        
+        Slices are updated in place while their names are unchanged; the
+        series is only rebuilt when slices are added, removed or reordered.
+        """
+        if not self._data_changed(data):
+            return
+        slices_data = data.get("slices", [])
+        
+        if self._series is not None and (
+            [slice.label() for slice in self._series.slices()]
+            == [slice_data["name"] for slice_data in slices_data]
+        ):
+            for slice, slice_data in zip(self._series.slices(), slices_data):
+                slice.setValue(slice_data["value"])
+                slice.setBrush(self._color(slice_data["color"]))
+            return
+        
         self.clear_chart()
         
         series = QPieSeries()
-        for slice_data in data.get("slices", []):
+        for slice_data in slices_data:
             slice = series.append(slice_data["name"], slice_data["value"])
-            color = QColor(slice_data["color"])
+            color = self._color(slice_data["color"])
             slice.setBrush(color)
             slice.setLabelVisible(True)
             slice.setLabelPosition(QPieSlice.LabelOutside)
             slice.setLabelArmLengthFactor(0.35)
             
         self.chart.addSeries(series)
+        self._series = series
 
 class BarChartCard(ChartBaseCard):
     """Card widget for displaying bar charts"""
@@ -158,18 +194,62 @@ class BarChartCard(ChartBaseCard):
         theme: Optional[ChartTheme] = None,
         parent=None
     ):
+        self._series: Optional[QBarSeries] = None
+        self._axis_x: Optional[QBarCategoryAxis] = None
+        self._axis_y: Optional[QValueAxis] = None
         super().__init__(title, description_text, theme, parent)
         self.update_chart(data)
         
     def update_chart(self, data: Dict[str, Any]):
-        """Update bar chart with new data"""
-        self._cached_data = data
+        """Update bar chart with new data
+        
+        While the bar sets keep the same names and lengths, only the changed
+        values and categories are updated; otherwise the chart is rebuilt.
+        """
+        if not self._data_changed(data):
+            return
+        series_data = data.get("series", [])
+        
+        if not self._same_bar_sets(series_data):
+            self._build_chart(data)
+            return
+        
+        values_changed = False
+        for bar_set, serie_data in zip(self._series.barSets(), series_data):
+            bar_set.setColor(self._color(serie_data["color"]))
+            for index, value in enumerate(serie_data["values"]):
+                if bar_set.at(index) != value:
+                    bar_set.replace(index, value)
+                    values_changed = True
+        
+        if values_changed:
+            # The value axis keeps its range on in-place edits; fit it like a fresh axis
+            values = [value for serie_data in series_data for value in serie_data["values"]]
+            self._axis_y.setRange(min(0, *values), max(0, *values))
+        
+        categories = list(data.get("categories", []))
+        if self._axis_x.categories() != categories:
+            self._axis_x.setCategories(categories)
+            
+    def _same_bar_sets(self, series_data) -> bool:
+        """Whether the chart already holds bar sets of these names and lengths"""
+        if self._series is None:
+            return False
+        bar_sets = self._series.barSets()
+        return len(bar_sets) == len(series_data) and all(
+            bar_set.label() == serie_data["name"]
+            and bar_set.count() == len(serie_data["values"])
+            for bar_set, serie_data in zip(bar_sets, series_data)
+        )
+        
+    def _build_chart(self, data: Dict[str, Any]):
+        """Create the series and axes from scratch"""
         self.clear_chart()
         
         series = QBarSeries()
         for serie_data in data.get("series", []):
             bar_set = QBarSet(serie_data["name"])
-            color = QColor(serie_data["color"])
+            color = self._color(serie_data["color"])
             bar_set.setColor(color)
             bar_set.append(serie_data["values"])
             series.append(bar_set)
@@ -185,4 +265,8 @@ class BarChartCard(ChartBaseCard):
         # Axe des valeurs (Y)
         axis_y = QValueAxis()
         self.chart.addAxis(axis_y, Qt.AlignLeft)
-        series.attachAxis(axis_y)
\ No newline at end of file
+        series.attachAxis(axis_y)
+        
+        self._series = series
+        self._axis_x = axis_x
+        self._axis_y = axis_y
@@ -4,7 +4,8 @@ This module provides a card widget for displaying data in a table format,
 with a simplified version of GenericTableView.
 """
 
-from typing import Optional, List, Dict, Any
+from itertools import islice
+from typing import Optional, Iterable, List, Dict, Any
 from ...core.commons import (
     QFrame,
     QVBoxLayout,
@@ -16,19 +17,43 @@ from ...core.commons import (
     QColor,
 )
 from ...widgets.text import Text
+from ._layouts import themed_layout
 from ..themes.table_card import TableCardTheme, TableCardThemes
 from ...core.themes.themes import ThemeManager
 
 class TableCardModel(QAbstractTableModel):
-    """Simple table model for TableCard"""
+    """Simple table model for TableCard
+    
+    Display strings and alignments are computed once per data update, so
+    painting a cell is a plain list lookup.
+    """
+    
+    _ALIGN_NUMBER = Qt.AlignRight | Qt.AlignVCenter
+    _ALIGN_TEXT = Qt.AlignLeft | Qt.AlignVCenter
     
     def __init__(self, headers: List[str], data: List[Dict[str, Any]], parent=None):
         super().__init__(parent)
         self.headers = headers
+        self._set_data(data)
+        
+    def _set_data(self, data: List[Dict[str, Any]]):
+        """Store data and precompute the display text and alignment of each cell"""
         self._data = data
+        self._cells = [
+            [str(row.get(header, "")) for header in self.headers]
+            for row in data
+        ]
+        self._alignments = [
+            [
+                self._ALIGN_NUMBER if isinstance(row.get(header), (int, float))
+                else self._ALIGN_TEXT
+                for header in self.headers
+            ]
+            for row in data
+        ]
         
     def rowCount(self, parent=QModelIndex()) -> int:
-        return len(self._data)
+        return len(self._cells)
         
     def columnCount(self, parent=QModelIndex()) -> int:
         return len(self.headers)
@@ -38,13 +63,10 @@ class TableCardModel(QAbstractTableModel):
             return None
             
         if role == Qt.DisplayRole:
-            return str(self._data[index.row()].get(self.headers[index.column()], ""))
+            return self._cells[index.row()][index.column()]
             
         elif role == Qt.TextAlignmentRole:
-            value = self._data[index.row()].get(self.headers[index.column()])
-            if isinstance(value, (int, float)):
-                return Qt.AlignRight | Qt.AlignVCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
+            return self._alignments[index.row()][index.column()]
             
         return None
         
@@ -55,8 +77,9 @@ class TableCardModel(QAbstractTableModel):
 
     def update_data(self, new_data: List[Dict[str, Any]]):
         """Update model data"""
-        self._data = new_data
-        self.layoutChanged.emit()
+        self.beginResetModel()
+        self._set_data(new_data)
+        self.endResetModel()
         
 class TableCard(QFrame):
     """Card widget for displaying tables
@@ -70,7 +93,7 @@ class TableCard(QFrame):
         title: str,
         description: str,
         headers: List[str],
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         theme: Optional[TableCardTheme] = None,  
         max_rows: int = 5,
         parent=None
@@ -80,7 +103,7 @@ class TableCard(QFrame):
         self.title = title
         self.description = description
         self.headers = headers
-        self.data = data[:max_rows]
+        self.data = list(islice(data, max_rows))
         self.theme = theme or TableCardThemes.LIGHT  
         self.max_rows = max_rows
         
@@ -89,14 +112,7 @@ class TableCard(QFrame):
         
     def setup_ui(self):
         """Initialize the card UI components"""
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(
-            self.theme.padding,
-            self.theme.padding,
-            self.theme.padding,
-            self.theme.padding
-        )
-        self.layout.setSpacing(self.theme.spacing)
+        self.layout = themed_layout(QVBoxLayout, self, self.theme)
         
         # Title
         self.title_label = Text(
@@ -110,7 +126,8 @@ class TableCard(QFrame):
         self.table = QTableView()
         self.table.setWordWrap(True)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        # Columns are sized explicitly once per data change (see resize_columns)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionBehavior(QTableView.SelectRows)
         self.table.setSelectionMode(QTableView.SingleSelection)
@@ -120,6 +137,7 @@ class TableCard(QFrame):
         # Set model
         self.model = TableCardModel(self.headers, self.data)
         self.table.setModel(self.model)
+        self.resize_columns()
         self.table.setMinimumHeight(300)
         self.table.setMinimumWidth(300)
         self.layout.addWidget(self.table)
@@ -128,12 +146,6 @@ class TableCard(QFrame):
         self.separator = QFrame()
         self.separator.setObjectName("separator")
         self.separator.setFixedHeight(self.theme.separator_height)
-        self.separator.setStyleSheet(f"""
-            #separator {{
-                background-color: {self.theme.separator_color};
-                margin: 5px 0px;
-            }}
-        """)
         self.layout.addWidget(self.separator)
         
         # Footer with description
@@ -151,11 +163,17 @@ class TableCard(QFrame):
         self.setStyleSheet(self.theme.get_card_stylesheet())
         self.table.setStyleSheet(self.theme.get_table_stylesheet())
         
-    def update_data(self, new_data: List[Dict[str, Any]]):
+    def update_data(self, new_data: Iterable[Dict[str, Any]]):
         """Update table with new data
         
         Args:
-            new_data: New data to display in table
+            new_data: New data to display in table; any iterable, only the
+                first max_rows rows are read
         """
-        self.data = new_data[:self.max_rows]
-        self.model.update_data(self.data) 
\ No newline at end of file
+        self.data = list(islice(new_data, self.max_rows))
+        self.model.update_data(self.data)
+        self.resize_columns()
+        
+    def resize_columns(self):
+        """Fit the columns to the current data in a single measuring pass"""
+        self.table.resizeColumnsToContents() 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Callable, Dict, Union
 
 from ..core.commons import (
     QWidget,
@@ -19,6 +19,11 @@ class Page(QWidget):
     This class provides a standard structure and lifecycle methods for dashboard pages.
     Each page consists of a header with a title and a content area that can be customized.
     
+    The page specific content is built lazily: setup_content runs the first
+    time the page is shown, not in __init__, so pages that are never visited
+    cost only their header. Widgets created in setup_content are therefore not
+    available right after construction; use them from load_data or later.
+    
     Args:
         title (str): The page title displayed in the header
         parent (QWidget, optional): The parent widget. Defaults to None.
@@ -28,6 +33,7 @@ class Page(QWidget):
         super().__init__(parent)
         self.title = title
         self.is_loaded = False
+        self._content_ready = False
         
         # Main layout
         self.main_layout = QVBoxLayout(self)
@@ -44,8 +50,7 @@ class Page(QWidget):
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.addWidget(self.content)
         
-        # Setup page specific content
-        self.setup_content()
+        # Page specific content is set up on the first show (see _ensure_content)
         
     def setup_header(self):
         """Initialize the page header with title"""
@@ -66,11 +71,27 @@ class Page(QWidget):
     def setup_content(self):
         """Override this method to initialize page specific content
         
-        This method is called during initialization and should be used
-        to create and setup all widgets specific to this page.
+        This method is called the first time the page is shown, before
+        load_data, and should be used to create and setup all widgets
+        specific to this page.
         """
         pass
     
+    def _ensure_content(self):
+        """Run setup_content once, the first time the page is needed"""
+        if not self._content_ready:
+            self._content_ready = True
+            self.setup_content()
+    
+    def showEvent(self, event):
+        """Build the page content before its first paint
+        
+        Covers the page shown by default by the content area, which never
+        goes through ContentArea.show_page.
+        """
+        self._ensure_content()
+        super().showEvent(event)
+    
     def on_show(self):
         """Called when the page becomes visible
         
@@ -176,18 +197,28 @@ class ContentArea(QFrame):
         self.scroll_area.setWidget(self.scroll_content)
         self.main_layout.addWidget(self.scroll_area)
         
-        # Dictionnaire pour stocker les routes des pages
-        self.routes: Dict[str, int] = {}
+        # Dictionnaire pour stocker les routes des pages : index dans la pile,
+        # ou fabrique de la page tant qu'elle n'a pas encore été affichée
+        self.routes: Dict[str, Union[int, Callable[[], QWidget]]] = {}
         
-    def add_page(self, route: str, page: QWidget):
+    def add_page(self, route: str, page: Union[QWidget, Callable[[], QWidget]]):
         """Ajouter une nouvelle page
         
         Args:
             route: Route unique pour accéder à la page
-            page: Widget de la page à ajouter
+            page: Widget de la page à ajouter, ou fabrique sans argument
+                (classe de la page, lambda: MyPage()) qui ne sera appelée
+                qu'au premier affichage de la page
+                
+        La première page ajoutée est affichée par défaut : une fabrique
+        passée alors que la pile est vide est donc appelée immédiatement.
         """
-        index = self.pages.addWidget(page)
-        self.routes[route] = index
+        if not isinstance(page, QWidget) and self.pages.count() == 0:
+            page = page()
+        if isinstance(page, QWidget):
+            self.routes[route] = self.pages.addWidget(page)
+        else:
+            self.routes[route] = page
         
     def show_page(self, route: str):
         """Afficher une page spécifique
@@ -200,9 +231,17 @@ class ContentArea(QFrame):
             if hasattr(current_widget, 'on_hide'):
                 current_widget.on_hide()
                 
-            self.pages.setCurrentIndex(self.routes[route])
+            index = self.routes[route]
+            if callable(index):
+                # Première visite : construire la page et garder son index
+                index = self.routes[route] = self.pages.addWidget(index())
+            self.pages.setCurrentIndex(index)
             
             new_widget = self.pages.currentWidget()
+            if isinstance(new_widget, Page):
+                # The page may not be visible yet (hidden dashboard), but
+                # on_show and load_data expect its widgets to exist
+                new_widget._ensure_content()
             if hasattr(new_widget, 'on_show'):
                 new_widget.on_show()
                 
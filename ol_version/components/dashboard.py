@@ -4,7 +4,7 @@ This module contains the Dashboard class which manages the overall layout includ
 sidebar, navbar, content area and footer.
 """
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict, Union
 
 from ..core.commons import (
     QWidget,
@@ -89,12 +89,13 @@ class Dashboard(QWidget):
         # Appliquer le thème
         self.apply_theme()
 
-    def add_page(self, route: str, page: QWidget):
+    def add_page(self, route: str, page: Union[QWidget, Callable[[], QWidget]]):
         """Ajouter une page au dashboard
         
         Args:
             route: Route unique de la page
-            page: Widget de la page à ajouter
+            page: Widget de la page à ajouter, ou fabrique sans argument
+                appelée au premier affichage de la page
         """
         self.content.add_page(route, page)
 
@@ -1,9 +1,42 @@
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from ..core.commons import QWidget, QLabel, Qt, QPixmap, QImage
 
 from .themes.image_widget_theme import ImageTheme, ImageThemes
 
+# Decoded (and scaled) pixmaps keyed by (path, width, height, keep_aspect_ratio).
+# QPixmap is implicitly shared, so widgets showing the same image share one copy.
+_PIXMAP_CACHE: Dict[Tuple[str, Optional[int], Optional[int], bool], QPixmap] = {}
+
+
+def _load_pixmap(
+    image_path: str,
+    width: Optional[int],
+    height: Optional[int],
+    keep_aspect_ratio: bool
+) -> QPixmap:
+    """Charge l'image depuis le cache, en la décodant au premier appel"""
+    key = (image_path, width, height, keep_aspect_ratio)
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(image_path)
+        if pixmap.isNull():
+            return pixmap
+        if width and height:
+            pixmap = pixmap.scaled(
+                width,
+                height,
+                Qt.KeepAspectRatio if keep_aspect_ratio else Qt.IgnoreAspectRatio,
+                Qt.SmoothTransformation
+            )
+        _PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+
+def clear_pixmap_cache():
+    """Vide le cache des images (à appeler si un fichier image change sur le disque)"""
+    _PIXMAP_CACHE.clear()
+
 class ImageWidget(QLabel):
     def __init__(
         self,
@@ -27,9 +60,9 @@ class ImageWidget(QLabel):
         self.apply_theme()
         
         # Chargement de l'image
-        self._pixmap = QPixmap(image_path)
+        self._pixmap = self._load()
         if not self._pixmap.isNull():
-            self._setup_image()
+            self.setPixmap(self._pixmap)
         else:
             raise(f"Erreur: Impossible de charger l'image: {image_path}")
     
@@ -45,32 +78,26 @@ class ImageWidget(QLabel):
         self._theme = theme
         self.apply_theme()
         
+    def _load(self) -> QPixmap:
+        """Récupère l'image aux dimensions courantes"""
+        return _load_pixmap(
+            self._image_path, self._width, self._height, self._keep_aspect_ratio
+        )
+
     def _setup_image(self):
         """Configure l'affichage de l'image"""
-        if self._width and self._height:
-            if self._keep_aspect_ratio:
-                self._pixmap = self._pixmap.scaled(
-                    self._width,
-                    self._height,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-            else:
-                self._pixmap = self._pixmap.scaled(
-                    self._width,
-                    self._height,
-                    Qt.IgnoreAspectRatio,
-                    Qt.SmoothTransformation
-                )
-        
+        pixmap = self._load()
+        if not pixmap.isNull():
+            self._pixmap = pixmap
         self.setPixmap(self._pixmap)
         
     def set_image(self, image_path: str):
         """Change l'image affichée"""
         self._image_path = image_path
-        self._pixmap = QPixmap(image_path)
-        if not self._pixmap.isNull():
-            self._setup_image()
+        pixmap = self._load()
+        if not pixmap.isNull():
+            self._pixmap = pixmap
+            self.setPixmap(pixmap)
             
     def resize_image(self, width: int, height: int):
         """Redimensionne l'image"""
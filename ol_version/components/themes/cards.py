@@ -47,6 +47,15 @@ class CardTheme:
             #baseCard:hover {{
                 margin: 0px 3px 6px 3px;
             }}
+            
+            #iconContainer {{
+                border-radius: {(self.icon_size + 20) // 2}px;
+            }}
+            
+            #separator {{
+                background-color: {self.separator_color};
+                margin: 5px 0px;
+            }}
         """
 
 class CardThemes:
@@ -28,6 +28,10 @@ class ChartTheme:
     footer_color: str = "#9A9A9A"
     footer_font_size: int = 12
     
+    # Rendu
+    antialias: bool = True
+    animate_updates: bool = True
+    
     def get_card_stylesheet(self) -> str:
         """Generate chart card stylesheet"""
         return f"""
@@ -36,6 +40,11 @@ class ChartTheme:
                 border-radius: {self.border_radius}px;
                 border: 1px solid {self.border_color};
             }}
+            
+            #separator {{
+                background-color: {self.separator_color};
+                margin: 5px 0px;
+            }}
         """
 
 class ChartThemes:
@@ -48,6 +48,11 @@ class TableCardTheme:
                 border-radius: {self.border_radius}px;
                 border: 1px solid {self.border_color};
             }}
+            
+            #separator {{
+                background-color: {self.separator_color};
+                margin: 5px 0px;
+            }}
         """
 
     def get_table_stylesheet(self) -> str:
@@ -1,4 +1,4 @@
-from sqlalchemy import delete, and_, desc, asc, func
+from sqlalchemy import delete, and_, or_, desc, asc, func
 from sqlalchemy.inspection import inspect
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.orm import DeclarativeBase
@@ -392,6 +392,92 @@ class BaseController(Generic[ModelType]):
         """
         return self.count(**filters) > 0
 
+    def exists_any(self, **filters) -> bool:
+        """
+        Check if any record matches at least one of the given filters.
+
+        All criteria are combined with OR and checked in a single query.
+
+        Args:
+            **filters: Filtering criteria.
+
+        Returns:
+            bool: True if a record matches any criterion, False otherwise.
+        """
+        conditions = self._any_conditions(filters)
+        if not conditions:
+            return False
+        try:
+            query = session.query(self.model.id).filter(or_(*conditions)).limit(1)
+            return query.first() is not None
+        finally:
+            session.close()
+
+    def find_any(self, **filters) -> List[ModelType]:
+        """
+        Find the records matching at least one of the given filters.
+
+        All criteria are combined with OR and resolved in a single query.
+
+        Args:
+            **filters: Filtering criteria.
+
+        Returns:
+            List[ModelType]: Matching records.
+        """
+        conditions = self._any_conditions(filters)
+        if not conditions:
+            return []
+        try:
+            return session.query(self.model).filter(or_(*conditions)).all()
+        finally:
+            session.close()
+
+    def _any_conditions(self, filters: Dict[str, Any]) -> List:
+        """Equality conditions for the filters naming a column of the model"""
+        return [
+            getattr(self.model, key) == value
+            for key, value in filters.items()
+            if hasattr(self.model, key)
+        ]
+
+    def update_where(self, filters: Dict[str, Any], **kwargs) -> int:
+        """
+        Update every record matching the given filters in a single statement.
+
+        Args:
+            filters: Filtering criteria selecting the records to update.
+            **kwargs: New field values for the records.
+
+        Returns:
+            int: Number of records updated.
+
+        Raises:
+            SQLAlchemyError: For any database-related errors.
+            ValueError: If invalid fields are provided.
+        """
+        try:
+            invalid_fields = [
+                field for field in kwargs.keys()
+                if not hasattr(self.model, field)
+            ]
+            if invalid_fields:
+                raise ValueError(f"Invalid fields: {', '.join(invalid_fields)}")
+
+            query = self._apply_filters(session.query(self.model), filters)
+            rows_updated = query.update(kwargs, synchronize_session=False)
+            session.commit()
+            return rows_updated
+
+        except ValueError:
+            session.rollback()
+            raise
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise SQLAlchemyError(f"Database error: {str(e)}")
+        finally:
+            session.close()
+
     def update(self, id_: int, **kwargs) -> ModelType:
         """
         Update an existing record with new values.
@@ -1,10 +1,37 @@
 from typing import Optional, Any, Callable, Dict
 
-from ..core.commons import QEvent, QObject
+from ..core.commons import QApplication, QTimer, QWidget
 from .base_widget import BaseWidget
 from ..widgets.text import Text
 from .themes.themes import ThemeManager
 
+# Inner field widgets mapped to their form field, fed by QApplication.focusChanged
+_focus_targets: Dict[QWidget, "BaseFormField"] = {}
+_focus_app: Optional[QApplication] = None
+
+
+def _find_focus_target(widget: Optional[QWidget]) -> Optional["BaseFormField"]:
+    """Return the form field owning ``widget`` or one of its ancestors."""
+    while widget is not None:
+        field = _focus_targets.get(widget)
+        if field is not None:
+            return field
+        widget = widget.parentWidget()
+    return None
+
+
+def _dispatch_focus_change(old: Optional[QWidget], new: Optional[QWidget]) -> None:
+    """Forward an application focus change to the affected form fields."""
+    old_field = _find_focus_target(old)
+    new_field = _find_focus_target(new)
+    if old_field is new_field:
+        return
+    if old_field is not None:
+        old_field.on_focus_out()
+    if new_field is not None:
+        new_field.on_focus_in()
+
+
 class BaseFormField(BaseWidget):
     """
     Base class for all form field widgets in the application.
@@ -99,6 +126,10 @@ class BaseFormField(BaseWidget):
         """
         Initialize the UI elements for the form field.
         """
+        # Single-shot timer debouncing validation while the user is typing
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.timeout.connect(self.is_valid)
         
         # Création des éléments du formulaire
         self._create_label()
@@ -222,27 +253,25 @@ class BaseFormField(BaseWidget):
         else:
             self.is_valid()
     
-    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+    def _track_focus(self) -> None:
         """
-        Handle focus events for form fields.
-
-        Args:
-            watched (QObject): The object being watched
-            event (QEvent): The event that occurred
+        Route focus changes of the inner form field widget to
+        on_focus_in/on_focus_out.
 
-        Returns:
-            bool: True if the event was handled, False otherwise
+        A single application-wide focusChanged connection is used instead of
+        an event filter, so the inner widget's other events (paint, mouse
+        moves...) never reach Python.
         """
-        # Check if the event is from the form field widget
-        if watched == self._form_field_widget:
-            # Handle focus events
-            if event.type() == QEvent.FocusOut:
-                self.on_focus_out()
+        global _focus_app
 
-            if event.type() == QEvent.FocusIn:
-                self.on_focus_in()
+        app = QApplication.instance()
+        if app is not _focus_app:
+            app.focusChanged.connect(_dispatch_focus_change)
+            _focus_app = app
 
-        return super().eventFilter(watched, event)
+        widget = self._form_field_widget
+        _focus_targets[widget] = self
+        widget.destroyed.connect(lambda: _focus_targets.pop(widget, None))
         
     def on_value_changed(self, value: Any) -> None:
         """
@@ -255,7 +284,8 @@ class BaseFormField(BaseWidget):
         
         if self._on_change:
             self._on_change(value)
-        self.is_valid()
+        # Restarting the timer coalesces a burst of changes into one validation
+        self._validate_timer.start(100)
     
     @property
     def value(self) -> Any:
@@ -23,6 +23,8 @@ from PySide6.QtCore import (
     QSortFilterProxyModel,
     QPropertyAnimation,
     QEasingCurve,
+    QRunnable,
+    QThreadPool,
     
 )
 
@@ -151,4 +153,6 @@ __all__ = [
     "QObject",
     "QPropertyAnimation",
     "QEasingCurve",
+    "QRunnable",
+    "QThreadPool",
 ]
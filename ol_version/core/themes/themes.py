@@ -123,19 +123,19 @@ class FontLoader:
 
         for font_name, font_path in cls.FONT_PATHS.items():
             if not font_path.exists():
-                logger.error(f"Fichier de police manquant : {font_path}")
+                logger.error("Fichier de police manquant : %s", font_path)
                 cls._missing_fonts.append(str(font_path))
                 success = False
                 continue
 
             font_id = font_db.addApplicationFont(str(font_path))
             if font_id == -1:
-                logger.error(f"Échec du chargement de la police : {font_path}")
+                logger.error("Échec du chargement de la police : %s", font_path)
                 cls._missing_fonts.append(str(font_path))
                 success = False
             else:
                 loaded_fonts = font_db.applicationFontFamilies(font_id)
-                logger.info(f"Police chargée : {loaded_fonts} depuis {font_path}")
+                logger.info("Police chargée : %s depuis %s", loaded_fonts, font_path)
 
         if not success:
             logger.warning(
@@ -1,6 +1,6 @@
 from pathlib import Path
-from typing import Optional, Union
-from .commons import QIcon
+from typing import Any, Callable, Optional, Set, Union
+from .commons import QIcon, QObject, QRunnable, QThreadPool, Signal
 
 def set_app_icon(app, icon_path: Optional[Union[str, Path]] = None):
     if icon_path is None:
@@ -12,4 +12,56 @@ def set_app_icon(app, icon_path: Optional[Union[str, Path]] = None):
     if not icon_path.exists():
         raise FileNotFoundError(f"Le fichier d'icône {icon_path} n'existe pas")
 
-    app.setWindowIcon(QIcon(str(icon_path)))
\ No newline at end of file
+    app.setWindowIcon(QIcon(str(icon_path)))
+
+
+class _TaskSignals(QObject):
+    succeeded = Signal(object)
+    failed = Signal(object)
+
+
+class _Task(QRunnable):
+    def __init__(self, fn: Callable[[], Any]):
+        super().__init__()
+        self.fn = fn
+        # Created in the calling thread, so connected slots run there
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.succeeded.emit(result)
+
+
+# Tasks kept alive until their result has been delivered
+_pending_tasks: Set[_Task] = set()
+
+
+def run_in_background(
+    fn: Callable[[], Any],
+    on_success: Callable[[Any], None],
+    on_error: Optional[Callable[[Exception], None]] = None
+):
+    """
+    Run fn on the global QThreadPool and hand its result back to the caller's thread
+    Args:
+        fn: Blocking CPU work to run (password hashing...). It must not use the
+            controllers: they share one database session, which is not
+            thread-safe, so database calls stay on the GUI thread.
+        on_success: Called with the return value of fn
+        on_error: Called with the exception raised by fn, if any
+    """
+    task = _Task(fn)
+
+    def finish(callback, value):
+        _pending_tasks.discard(task)
+        if callback is not None:
+            callback(value)
+
+    task.signals.succeeded.connect(lambda result: finish(on_success, result))
+    task.signals.failed.connect(lambda error: finish(on_error, error))
+    _pending_tasks.add(task)
+    QThreadPool.globalInstance().start(task)
@@ -218,12 +218,13 @@ if __name__ == "__main__":
         theme=DashboardThemes.LIGHT,
         
     )
-    # Ajouter des pages
+    # Ajouter des pages : une instance, ou une fabrique (la classe, une lambda)
+    # pour ne construire la page qu'à sa première visite
     dashboard.add_page("/home", HomePage())
-    dashboard.add_page("/some", SomePage())
-    dashboard.add_page("/settings", SettingsPage())
-    dashboard.add_page("/page_2", Page2())
-    dashboard.add_page("/custom", MaPage())
+    dashboard.add_page("/some", SomePage)
+    dashboard.add_page("/settings", SettingsPage)
+    dashboard.add_page("/page_2", lambda: Page2())
+    dashboard.add_page("/custom", MaPage)
 
     dashboard.showMaximized()
     sys.exit(app.exec())
@@ -94,7 +94,7 @@ class Checkbox(BaseFormField):
 
         # Connect signals
         self.checkbox.stateChanged.connect(self._handle_state_changed)
-        self._form_field_widget.installEventFilter(self)
+        self._track_focus()
 
         # Add to layout
         self.checkbox_layout.addWidget(self.checkbox)
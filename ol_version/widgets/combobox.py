@@ -114,7 +114,7 @@ class ComboBox(BaseFormField):
 
         # Connect signals
         self.combobox.currentIndexChanged.connect(self.on_value_changed)
-        self._form_field_widget.installEventFilter(self)
+        self._track_focus()
 
         # Add to layout
         self.combobox_layout.addWidget(self.combobox)
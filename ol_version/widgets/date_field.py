@@ -110,7 +110,7 @@ class DateField(BaseFormField):
 
         # Connect signals
         self.date_edit.dateChanged.connect(self.on_value_changed)
-        self._form_field_widget.installEventFilter(self)
+        self._track_focus()
 
         # Add to layout
         self.date_layout.addWidget(self.date_edit)
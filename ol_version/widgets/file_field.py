@@ -152,9 +152,9 @@ class FileField(BaseFormField):
         # Add the field layout to the main layout
         self.main_layout.addLayout(field_layout)
         
-        # Set the form field widget for event filtering
+        # Set the form field widget for focus tracking
         self._form_field_widget = self._input
-        self._input.installEventFilter(self)
+        self._track_focus()
 
     def _show_file_dialog(self) -> None:
         """Show the file selection dialog based on configuration."""
@@ -7,6 +7,23 @@ from ..core.base_form_field import BaseFormField
 from .button import IconButton
 from ..core.themes.themes import TextFieldTheme, ThemeManager
 
+# Built-in validation patterns, compiled once and shared by every field
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+_NUMERIC_RE = re.compile(r"^-?\d+(\.\d+)?$")
+
+
+def _is_plausible_email(text: str) -> bool:
+    """Lightweight email check: one '@', non-empty local part, dotted domain, no spaces."""
+    at = text.find("@")
+    return (
+        0 < at < len(text) - 3
+        and text.find("@", at + 1) == -1
+        and "." in text[at + 1:]
+        and text[-1] != "."
+        and " " not in text
+    )
+
+
 class InputFilter(Enum):
     """Available input filter types."""
     TEXT = "text"
@@ -47,6 +64,8 @@ class TextFieldBase(BaseFormField):
         validation_message (Optional[str]): Error message for pattern validation
     """
 
+    _strict_email: bool = False
+
     def __init__(
         self,
         key: Optional[str] = None,
@@ -102,6 +121,7 @@ class TextFieldBase(BaseFormField):
         self._min_length = min_length
         self._max_length = max_length
         self._validation_pattern = validation_pattern
+        self._validation_regex = re.compile(validation_pattern) if validation_pattern else None
         self._validation_message = validation_message or default_errors["pattern"]
 
         # Initialize base form field
@@ -160,7 +180,7 @@ class TextFieldBase(BaseFormField):
 
         # Connect signals
         self.line_edit.textChanged.connect(self.on_value_changed)
-        self._form_field_widget.installEventFilter(self)
+        self._track_focus()
 
         self.input_layout.addStretch(1)
         self.main_layout.addLayout(self.input_layout)
@@ -196,9 +216,11 @@ class TextFieldBase(BaseFormField):
             self.line_edit.textChanged.connect(self._validate_email)
 
     def _validate_email(self, text: str) -> bool:
-        """Validate email format."""
-        email_regex = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-        if text and not re.match(email_regex, text):
+        """Validate email format (full regex only in strict mode)."""
+        if not text:
+            return True
+        valid = _EMAIL_RE.match(text) if self._strict_email else _is_plausible_email(text)
+        if not valid:
             self.show_error(self._error_messages["email"])
             return False
         return True
@@ -217,8 +239,7 @@ class TextFieldBase(BaseFormField):
             return True
 
         # Validate numeric format
-        numeric_regex = r"^-?\d+(\.\d+)?$"
-        if not re.match(numeric_regex, text):
+        if not _NUMERIC_RE.match(text):
             self.show_error(self._error_messages["numeric"])
             return False
 
@@ -273,10 +294,10 @@ class TextFieldBase(BaseFormField):
         Returns:
             bool: True if pattern matches or no pattern specified
         """
-        if not text or not self._validation_pattern:
+        if not text or self._validation_regex is None:
             return True
 
-        if not re.match(self._validation_pattern, text):
+        if not self._validation_regex.match(text):
             self.show_error(self._validation_message)
             return False
             
@@ -449,6 +470,7 @@ class EmailField(TextFieldBase):
         read_only (bool): Read-only mode
         validation_pattern (Optional[str]): Additional regex pattern for validation
         validation_message (Optional[str]): Error message for pattern validation
+        strict (bool): Validate with the full email regex instead of the lightweight check
         on_change (Callable, optional): Value change callback
         on_focus (Callable, optional): Focus gained callback
         on_blur (Callable, optional): Focus lost callback
@@ -488,11 +510,13 @@ class EmailField(TextFieldBase):
         read_only: bool = False,
         validation_pattern: Optional[str] = None,
         validation_message: Optional[str] = None,
+        strict: bool = False,
         on_change: Optional[Callable] = None,
         on_focus: Optional[Callable] = None,
         on_blur: Optional[Callable] = None,
         parent = None,
     ) -> None:
+        self._strict_email = strict
         super().__init__(
             key=key,
             width=width,
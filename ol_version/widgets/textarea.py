@@ -107,7 +107,7 @@ class TextArea(BaseFormField):
         
         # Connect signals
         self.text_edit.textChanged.connect(self._handle_text_changed)
-        self._form_field_widget.installEventFilter(self)
+        self._track_focus()
 
         # Add to layout
         self.textarea_layout.addWidget(self.text_edit)